@@ -3,10 +3,22 @@ Day 1 solution.
 """
 from __future__ import annotations
 
+import array
+import concurrent.futures
+import functools
+import itertools
+import os
+import pathlib
 import sys
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Any
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.inputs import Buffer  # pylint: disable=wrong-import-position
+from aoc2023.inputs import open_input  # pylint: disable=wrong-import-position
+from aoc2023.inputs import read_bytes  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class TrieNode:
     """Trie node."""
@@ -22,9 +34,126 @@ class TrieNode:
         return self.children[key]
 
 
+class AhoCorasick:
+    """
+    Multi-pattern automaton over bytes.
+
+    The trie's missing transitions are filled in through the failure links,
+    so every byte is a single lookup in a flat array of 256 transitions per
+    state, and each state holds the value of the longest pattern ending
+    there, if any.
+    """
+
+    NO_MATCH = -1
+
+    def __init__(self, patterns: dict[bytes, int]) -> None:
+        goto = [[-1] * 256]
+        values = [self.NO_MATCH]
+        for pattern, value in patterns.items():
+            state = 0
+            for byte in pattern:
+                if goto[state][byte] == -1:
+                    goto[state][byte] = len(goto)
+                    goto.append([-1] * 256)
+                    values.append(self.NO_MATCH)
+                state = goto[state][byte]
+            values[state] = value
+
+        # Breadth first so each failure link's state is complete first
+        fail = [0] * len(goto)
+        queue = deque()
+        for byte, next_state in enumerate(goto[0]):
+            if next_state == -1:
+                goto[0][byte] = 0
+            else:
+                queue.append(next_state)
+        while queue:
+            state = queue.popleft()
+            if values[state] == self.NO_MATCH:
+                values[state] = values[fail[state]]
+            for byte, next_state in enumerate(goto[state]):
+                if next_state == -1:
+                    goto[state][byte] = goto[fail[state]][byte]
+                else:
+                    fail[next_state] = goto[fail[state]][byte]
+                    queue.append(next_state)
+
+        self.transitions = array.array(
+            "i", (next_state for row in goto for next_state in row)
+        )
+        self.values = values
+
+    def calibration_sum(self, data: bytes) -> int:
+        """
+        Sum the first and last match of every line, as a two digit number.
+        """
+        transitions, values = self.transitions, self.values
+        newline = ord("\n")
+        total = 0
+        state = 0
+        first = last = self.NO_MATCH
+        for byte in data:
+            if byte == newline:
+                total += first * 10 + last
+                first = last = self.NO_MATCH
+                state = 0
+                continue
+
+            state = transitions[state << 8 | byte]
+            value = values[state]
+            if value != self.NO_MATCH:
+                if first == self.NO_MATCH:
+                    first = value
+                last = value
+
+        if data and not data.endswith(b"\n"):
+            total += first * 10 + last
+        return total
+
+    def first_match(self, line: bytes | memoryview) -> int:
+        """The value of the first match in the line, stopping at it."""
+        transitions, values = self.transitions, self.values
+        state = 0
+        for byte in line:
+            state = transitions[state << 8 | byte]
+            if values[state] != self.NO_MATCH:
+                return values[state]
+        return self.NO_MATCH
+
+
+def chunk_bounds(data: Buffer, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Split the data into chunks of at least the chunk size, each ending just
+    after a newline so no line is split, except the last.
+    """
+    bounds = []
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start + chunk_size - 1)
+        end = len(data) if end == -1 else end + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def chunk_sums(filepath: str, start: int, end: int) -> tuple[int, int]:
+    """The part 1 and part 2 sums of the lines in a chunk of the file."""
+    with open_input(filepath) as data:
+        chunk = data[start:end]
+    solver = Solver(filepath)
+    return (
+        solver.calibration_sum(chunk, False),
+        solver.calibration_sum(chunk, True),
+    )
+
+
 class Solver:
     """Day 1 solver."""
 
+    parallel_threshold = 64 * 2**20
+    """Input size in bytes from which the sums are split across processes."""
+    chunk_size = 16 * 2**20
+
     words = [
         "one",
         "two",
@@ -39,56 +168,115 @@ class Solver:
 
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
+        self.sums: tuple[int, int] | None = None
 
         # Build trie for word to num mapping
         self.trie = TrieNode()
         for num, word in enumerate(self.words, start=1):
             curr = self.trie
-            for c in reversed(word):
+            for c in reversed(word.encode()):
                 curr = curr[c]
             curr.val = num
 
-    def general_solve(self, include_word_numbers: bool = False) -> int:
-        """Solving algorithm for part 1 and part 2."""
+    @parsed_input
+    def get_lines(self) -> bytes:
+        """Read the calibration lines."""
+        return read_bytes(self.filepath)
+
+    @classmethod
+    @functools.cache
+    def get_automaton(cls, include_word_numbers: bool) -> AhoCorasick:
+        """The automaton matching the digits and optionally the words."""
+        patterns = {str(num).encode(): num for num in range(10)}
+        if include_word_numbers:
+            patterns.update(
+                (word.encode(), num)
+                for num, word in enumerate(cls.words, start=1)
+            )
+        return AhoCorasick(patterns)
+
+    def last_match(
+        self, line: bytes | memoryview, include_word_numbers: bool
+    ) -> int:
+        """
+        The value of the last match in the line, scanning backwards from its
+        end with the reversed trie and stopping at the match.
+        """
+        zero, nine = ord("0"), ord("9")
+        for end in range(len(line) - 1, -1, -1):
+            if zero <= line[end] <= nine:
+                return line[end] - zero
+            if not include_word_numbers:
+                continue
 
-        def substr_to_num(substr: list[str]) -> int:
-            """
-            Converts the last substr to a number if valid, else returns -1.
-            """
             curr = self.trie
-            for c in reversed(substr):
-                if c not in curr:
+            for i in range(end, -1, -1):
+                if line[i] not in curr:
                     break
-                curr = curr[c]
-
+                curr = curr[line[i]]
                 if curr.val is not None:
                     return curr.val
-            return -1
-
-        def line_to_num(line: str) -> int:
-            first = last = -1
-            chars: list[str] = []
-            for c in line:
-                if c.isdigit():
-                    num = int(c)
-                    chars.clear()
-                elif not include_word_numbers:
-                    continue
-                else:
-                    chars.append(c)
-                    num = substr_to_num(chars)
-                    if num == -1:
-                        continue
-
-                if first == -1:
-                    first = num
-                last = num
-            return first * 10 + last
-
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            return sum(line_to_num(line) for line in file)
+        return AhoCorasick.NO_MATCH
+
+    def calibration_sum(
+        self,
+        data: bytes,
+        include_word_numbers: bool = False,
+        two_ended: bool = True,
+    ) -> int:
+        """
+        The sum of the calibration values of the lines in the data.
+
+        Two ended scans only read each line up to its first match and back
+        from its end to its last match, otherwise every byte is scanned.
+        """
+        automaton = self.get_automaton(include_word_numbers)
+        if not two_ended:
+            return automaton.calibration_sum(data)
+
+        total = 0
+        for line in data.splitlines():
+            first = automaton.first_match(line)
+            last = (
+                self.last_match(line, include_word_numbers)
+                if first != AhoCorasick.NO_MATCH
+                else first
+            )
+            total += first * 10 + last
+        return total
+
+    def parallel_sums(self, workers: int | None = None) -> tuple[int, int]:
+        """
+        The part 1 and part 2 sums, computed for chunks of the input in a
+        process pool and added together.
+        """
+        with open_input(self.filepath) as data:
+            bounds = chunk_bounds(data, self.chunk_size)
+        if not bounds:
+            return 0, 0
+
+        starts, ends = zip(*bounds)
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            sums = list(
+                executor.map(
+                    chunk_sums, itertools.repeat(self.filepath), starts, ends
+                )
+            )
+        return sum(part_1 for part_1, _ in sums), sum(
+            part_2 for _, part_2 in sums
+        )
+
+    def general_solve(self, include_word_numbers: bool = False) -> int:
+        """Solving algorithm for part 1 and part 2."""
+        if os.path.getsize(self.filepath) < self.parallel_threshold:
+            return self.calibration_sum(
+                self.get_lines(), include_word_numbers
+            )
+
+        # Both parts are summed at once, so only split the input once
+        if self.sums is None:
+            self.sums = self.parallel_sums()
+        return self.sums[include_word_numbers]
 
     def part_1(self):
         """Part 1 solver."""
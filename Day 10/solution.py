@@ -1,154 +1,98 @@
 """
 Day 10 solution.
 """
-import collections
-import enum
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.grid import Grid  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 10 solver."""
 
-    class Directions(enum.Enum):
-        """Possible move directions"""
-
-        NORTH = (-1, 0)
-        SOUTH = (1, 0)
-        EAST = (0, 1)
-        WEST = (0, -1)
-
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
+    @parsed_input
     def generate_graph(
         self,
-    ) -> tuple[
-        dict[tuple[int, int], list[tuple[int, int]]],
-        tuple[int, int],
-        set[tuple[int, int]],
-        int,
-        int,
-    ]:
+    ) -> tuple[Grid, dict[int, tuple[int, ...]], int]:
         """
-        Generate the graph.
+        Generate the graph, mapping each pipe's flat index to the flat
+        offsets it connects to, with the start's flat index.
         """
-        graph = {}
+        grid = Grid.from_file(self.filepath)
+        north, east, south, west = grid.directions()
         pipes = {
-            "|": [self.Directions.SOUTH.value, self.Directions.NORTH.value],
-            "-": [self.Directions.EAST.value, self.Directions.WEST.value],
-            "L": [self.Directions.NORTH.value, self.Directions.EAST.value],
-            "J": [self.Directions.NORTH.value, self.Directions.WEST.value],
-            "7": [self.Directions.SOUTH.value, self.Directions.WEST.value],
-            "F": [self.Directions.SOUTH.value, self.Directions.EAST.value],
+            ord("|"): (south, north),
+            ord("-"): (east, west),
+            ord("L"): (north, east),
+            ord("J"): (north, west),
+            ord("7"): (south, west),
+            ord("F"): (south, east),
+        }
+        graph = {
+            index: pipes[grid.data[index]]
+            for index in grid.find_all("".join(map(chr, pipes)))
         }
-        spaces = set()
-        m = n = 0
-        start = -1, -1
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            for i, line in enumerate(file):
-                for j, x in enumerate(line.strip()):
-                    if x == ".":
-                        spaces.add((i, j))
-                    elif x == "S":
-                        start = i, j
-                    else:
-                        graph[i, j] = pipes[x]
-                n = len(line)
-                m += 1
 
         # Determine start pipe directions
-        graph[start] = []
-        start_i, start_j = start
-        for d_i, d_j in (direction.value for direction in self.Directions):
-            next_node = start_i + d_i, start_j + d_j
-            if next_node not in graph:
-                continue
+        start = grid.find("S")
+        graph[start] = tuple(
+            offset
+            for offset in grid.directions()
+            if -offset in graph.get(start + offset, ())
+        )
 
-            if (-d_i, -d_j) in graph[next_node]:
-                graph[start].append((d_i, d_j))
-
-        return graph, start, spaces, m, n
+        return grid, graph, start
 
     @staticmethod
     def traverse_loop(
-        graph: dict[tuple[int, int], list[tuple[int, int]]],
-        start: tuple[int, int],
-    ) -> tuple[int, set[tuple[int, int]]]:
+        graph: dict[int, tuple[int, ...]], start: int
+    ) -> list[int]:
         """
-        Traverse the loop returning the depth from the start node and all nodes in the loop.
+        Traverse the loop returning its nodes in order from the start node.
         """
-        queue = collections.deque([start])
-        loop_nodes = set(queue)
-        steps = 0
-        while queue:
-            for _ in range(len(queue)):
-                i, j = queue.popleft()
-                for d_i, d_j in graph[i, j]:
-                    next_node = i + d_i, j + d_j
-                    if next_node not in loop_nodes and next_node in graph:
-                        queue.append(next_node)
-                        loop_nodes.add(next_node)
-            steps += 1
-
-        return steps - 1, loop_nodes
+        loop_nodes = [start]
+        offset = graph[start][0]
+        node = start + offset
+        while node != start:
+            loop_nodes.append(node)
+            offset = next(
+                next_offset
+                for next_offset in graph[node]
+                if next_offset != -offset
+            )
+            node += offset
+        return loop_nodes
 
     def part_1(self) -> int:
         """Part 1 solver."""
-        graph, start, *_ = self.generate_graph()
-        return self.traverse_loop(graph, start)[0]
+        _, graph, start = self.generate_graph()
+        return len(self.traverse_loop(graph, start)) // 2
 
     def part_2(self) -> int:
         """Part 2 solver."""
-        graph, start, spaces, m, n = self.generate_graph()
-
-        _, loop_nodes = self.traverse_loop(graph, start)
-
-        # Consider all pipes not in the loop as a space
-        spaces |= {node for node in graph if node not in loop_nodes}
-
-        # Enlarge map so a 1x1 element is 3x3
-        visited = {
-            (i * 3 + 1 + d_i, j * 3 + 1 + d_j)
-            for i, j in loop_nodes
-            for d_i, d_j in graph[i, j] + [(0, 0)]
-        }
-
-        def flood_mark_outside_nodes(
-            node: tuple[int, int],
-            visited: set[tuple[int, int]],
-            spaces: set[tuple[int, int]],
-        ) -> None:
-            if node in visited:
-                return
-            visited.add(node)
-
-            stack = [node]
-            while stack:
-                i, j = stack.pop()
-                if not 0 <= i < m * 3 or not 0 <= j < n * 3:
-                    continue
-
-                if i % 3 == 1 and j % 3 == 1:
-                    spaces.discard((i // 3, j // 3))
-
-                for d_i, d_j in (
-                    direction.value for direction in self.Directions
-                ):
-                    next_node = i + d_i, j + d_j
-                    if next_node not in visited:
-                        stack.append(next_node)
-                        visited.add(next_node)
-
-        for i in range(1, 3 * m, 3):
-            flood_mark_outside_nodes((i, 1), visited, spaces)
-            flood_mark_outside_nodes((i, (n - 1) * 3 + 1), visited, spaces)
-        for j in range(1, 3 * n, 3):
-            flood_mark_outside_nodes((1, j), visited, spaces)
-            flood_mark_outside_nodes(((m - 1) * 3 + 1, j), visited, spaces)
-
-        return len(spaces)
+        grid, graph, start = self.generate_graph()
+        north = grid.directions()[0]
+
+        # Scan each row, crossing into or out of the loop at every loop
+        # pipe connecting north
+        loop_nodes = bytearray(len(grid))
+        for node in self.traverse_loop(graph, start):
+            loop_nodes[node] = 1 + (north in graph[node])
+
+        result = 0
+        for row_start in range(0, len(grid), grid.stride):
+            inside = False
+            for node in range(row_start, row_start + grid.width):
+                if loop_nodes[node] == 2:
+                    inside = not inside
+                elif inside and not loop_nodes[node]:
+                    result += 1
+        return result
 
     def solve(self) -> None:
         """Runs part 1 and part 2."""
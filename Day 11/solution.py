@@ -3,8 +3,13 @@ Day 11 solution.
 """
 import bisect
 import itertools
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.grid import Grid  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 11 solver."""
@@ -35,26 +40,26 @@ class Solver:
             )
         )
 
+    @parsed_input
+    def get_galaxies(
+        self,
+    ) -> tuple[list[tuple[int, int]], list[int], list[int]]:
+        """
+        Get the galaxy positions with the empty rows and columns.
+        """
+        grid = Grid.from_file(self.filepath)
+        galaxies = [grid.position(index) for index in grid.find_all("#")]
+        empty_rows = [
+            i for i, row in enumerate(grid.rows()) if b"#" not in row
+        ]
+        empty_cols = [
+            j for j, col in enumerate(grid.columns()) if b"#" not in col
+        ]
+        return galaxies, empty_rows, empty_cols
+
     def generic_solve(self, expansion_factor: int) -> int:
         """Generic solver."""
-        galaxies: list[tuple[int, int]] = []
-        m = n = 0
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            for i, line in enumerate(file):
-                for j, x in enumerate(line.strip()):
-                    if x == "#":
-                        galaxies.append((i, j))
-                n = len(line)
-                m += 1
-
-        non_empty_rows = {i for i, _ in galaxies}
-        non_empty_cols = {j for _, j in galaxies}
-
-        empty_rows = [i for i in range(m) if i not in non_empty_rows]
-        empty_cols = [j for j in range(n) if j not in non_empty_cols]
-
+        galaxies, empty_rows, empty_cols = self.get_galaxies()
         return sum(
             self.distance(
                 *galaxy_pair, (empty_rows, empty_cols), expansion_factor
@@ -1,8 +1,12 @@
 """
 Day 12 solution.
 """
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 12 solver."""
@@ -57,31 +61,37 @@ class Solver:
             dp[i][j] = count_arrangements(symbols, nums, dp, i, j)
         return dp[i][j]
 
+    @parsed_input
+    def get_records(self) -> list[tuple[str, list[int]]]:
+        """Parse the file to get the symbol and number data of each row."""
+        with open(
+            self.filepath, "r", encoding=sys.getdefaultencoding()
+        ) as file:
+            return [
+                (symbols, [int(x) for x in num_data.split(",")])
+                for symbols, num_data in (line.split() for line in file)
+            ]
+
     @staticmethod
-    def parse_line(
-        line: str, num_repeat: int = 1
+    def unfold_record(
+        symbols: str, nums: list[int], num_repeat: int = 1
     ) -> tuple[str, list[int], list[list[int]]]:
         """
-        Parse the line to get the symbol and number data then generate the repeated
-        symbols, repeated numbers and the dp grid.
+        Generate the repeated symbols, repeated numbers and the dp grid.
         """
-        symbols, num_data = line.split()
         symbols = "?".join(symbols for _ in range(num_repeat))
-        nums = [int(x) for x in num_data.split(",")] * num_repeat
+        nums = nums * num_repeat
         dp = [[-1] * (len(nums) + 1) for _ in range(len(symbols) + 2)]
         return symbols, nums, dp
 
     def generic_solve(self, num_repeat: int = 1) -> int:
         """Generic solve"""
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            return sum(
-                self.count_arrangements(
-                    *self.parse_line(line, num_repeat), 0, 0
-                )
-                for line in file
+        return sum(
+            self.count_arrangements(
+                *self.unfold_record(symbols, nums, num_repeat), 0, 0
             )
+            for symbols, nums in self.get_records()
+        )
 
     def part_1(self) -> int:
         """Part 1 solver."""
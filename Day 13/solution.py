@@ -1,8 +1,13 @@
 """
 Day 13 solution.
 """
+import pathlib
 import sys
-from typing import Callable, Generator, Iterable, Sequence
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.grid import Grid, mask  # pylint: disable=wrong-import-position
+from aoc2023.inputs import read_bytes  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
 
 
 class Solver:
@@ -11,96 +16,73 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def graph_generator(self) -> Generator[list[str], None, None]:
+    @parsed_input
+    def get_graphs(self) -> list[tuple[list[int], list[int]]]:
         """
-        Parse the input file and generate one graph at a time.
+        Parse the input file to get the rows and columns of every graph as
+        masks of the rocks.
         """
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            line = file.readline()
-            while line != "":
-                graph = []
-                while line not in ["\n", ""]:
-                    graph.append(line.strip())
-                    line = file.readline()
+        blocks = (
+            read_bytes(self.filepath).replace(b"\r\n", b"\n").split(b"\n\n")
+        )
 
-                yield graph
-                line = file.readline()
+        graphs = []
+        for block in blocks:
+            if not block.strip():
+                continue
+            grid = Grid(block)
+            graphs.append(
+                (
+                    [mask(row, "#") for row in grid.rows()],
+                    [mask(col, "#") for col in grid.columns()],
+                )
+            )
+        return graphs
 
-    def generic_solve(
-        self,
-        is_valid_reflection: Callable[[Iterable[Sequence[str]], int], bool],
-    ) -> int:
+    @staticmethod
+    def num_differences(sequences: list[int], reflection_point: int) -> int:
+        """
+        The number of cells that differ from their reflection when the
+        sequences are reflected after the reflection point.
+        """
+        return sum(
+            (
+                sequences[reflection_point - i]
+                ^ sequences[reflection_point + i + 1]
+            ).bit_count()
+            for i in range(
+                min(  # Get the smaller of the left or right side
+                    reflection_point + 1,
+                    len(sequences) - reflection_point - 1,
+                )
+            )
+        )
+
+    def generic_solve(self, num_smudges: int) -> int:
         """Generic solve."""
         row_total = col_total = 0
-        for graph in self.graph_generator():
-            found_reflection = False
-
+        for rows, cols in self.get_graphs():
             # Check vertical reflection
-            for j in range(len(graph[0]) - 1):
-                if is_valid_reflection(graph, j):
+            for j in range(len(cols) - 1):
+                if self.num_differences(cols, j) == num_smudges:
                     col_total += j + 1
-                    found_reflection = True
-                    break
-            if found_reflection:
-                continue
-
-            # Check horizontal reflection
-            for i in range(len(graph) - 1):
-                if is_valid_reflection(zip(*graph), i):
-                    row_total += i + 1
                     break
+            else:
+                # Check horizontal reflection
+                for i in range(len(rows) - 1):
+                    if self.num_differences(rows, i) == num_smudges:
+                        row_total += i + 1
+                        break
 
         return col_total + 100 * row_total
 
     def part_1(self) -> int:
         """Part 1 solver."""
-
-        def is_valid_reflection(
-            reflection_sequences: Iterable[Sequence[str]],
-            reflection_point: int,
-        ) -> bool:
-            return all(
-                all(
-                    sequence[reflection_point - i]
-                    == sequence[reflection_point + i + 1]
-                    for i in range(
-                        min(  # Get the smaller of the left or right side
-                            reflection_point + 1,
-                            len(sequence) - reflection_point - 1,
-                        )
-                    )
-                )
-                for sequence in reflection_sequences
-            )
-
-        return self.generic_solve(is_valid_reflection)
+        return self.generic_solve(0)
 
     def part_2(self) -> int:
         """Part 2 solver."""
-
-        def is_valid_reflection(
-            sequences: Iterable[Sequence[str]], reflection_point: int
-        ) -> bool:
-            return (
-                sum(
-                    sum(
-                        sequence[reflection_point - i]
-                        != sequence[reflection_point + i + 1]
-                        for i in range(
-                            min(
-                                reflection_point + 1,
-                                len(sequence) - reflection_point - 1,
-                            )
-                        )
-                    )
-                    for sequence in sequences
-                )
-                == 1
-            )
-
-        return self.generic_solve(is_valid_reflection)
+        return self.generic_solve(1)
 
     def solve(self) -> None:
         """Runs part 1 and part 2."""
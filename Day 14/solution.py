@@ -2,8 +2,34 @@
 Day 14 solution.
 """
 import enum
+import pathlib
 import sys
-from typing import Sequence
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.grid import Grid  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
+
+class TiltedSegments(dict):
+    """
+    Memo of the segments between cubed rocks with every round rock rolled
+    to the start, or to the end if in reverse.
+    """
+
+    __slots__ = ("in_reverse",)
+
+    def __init__(self, in_reverse: bool) -> None:
+        super().__init__()
+        self.in_reverse = in_reverse
+
+    def __missing__(self, segment: bytes) -> bytes:
+        round_rock = Solver.symbols.ROUND_ROCKS.value.encode()
+        space = Solver.symbols.SPACES.value.encode()
+        rounds = round_rock * segment.count(round_rock)
+        spaces = space * (len(segment) - len(rounds))
+        tilted = spaces + rounds if self.in_reverse else rounds + spaces
+        self[segment] = tilted
+        return tilted
 
 
 class Solver:
@@ -11,6 +37,7 @@ class Solver:
 
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
+        self.tilted = (TiltedSegments(False), TiltedSegments(True))
 
     class symbols(enum.Enum):
         """Valid input symbols."""
@@ -19,167 +46,99 @@ class Solver:
         ROUND_ROCKS = "O"
         CUBED_ROCKS = "#"
 
-    def parse_file(
-        self,
-    ) -> tuple[list[list[int]], list[list[int]], int]:
+    @parsed_input
+    def parse_file(self) -> Grid:
         """
-        Parse the file to get the round rocks and the cubed rocks.
+        Parse the file to get the grid of round rocks and cubed rocks.
         """
-        round_rocks = []
-        cubed_rocks = []
-        n = 0
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            for i, line in enumerate(file):
-                round_rocks.append([])
-                cubed_rocks.append([])
-
-                for j, c in enumerate(line.strip()):
-                    if c == self.symbols.SPACES.value:
-                        continue
-
-                    if c == self.symbols.ROUND_ROCKS.value:
-                        round_rocks[i].append(j)
-                    elif c == self.symbols.CUBED_ROCKS.value:
-                        cubed_rocks[i].append(j)
-                    else:
-                        raise ValueError(
-                            f"Expected chars to either be '.', '#', or 'O', got '{c}'."
-                        )
-                n = len(line.strip())
-        return round_rocks, cubed_rocks, n
+        grid = Grid.from_file(self.filepath)
+        invalid = grid.cells & ~grid.mask(
+            "".join(symbol.value for symbol in self.symbols)
+        )
+        if invalid:
+            c = chr(grid.data[grid.indices(invalid)[0]])
+            raise ValueError(
+                f"Expected chars to either be '.', '#', or 'O', got '{c}'."
+            )
+        return grid
 
     @staticmethod
-    def transpose_row_list(
-        row_list: list[list[int]], new_length: int
-    ) -> list[list[int]]:
-        """Transpose the graph."""
-        if not row_list:
-            raise ValueError("Cannot transpose empty row list.")
-
-        result = [[] for _ in range(new_length)]
-        for i, row in enumerate(row_list):
-            for j in row:
-                result[j].append(i)
-        return result
+    def transpose(rocks: bytes, width: int) -> bytes:
+        """
+        Swap the rows and columns of the rocks, where each line of the given
+        width is ended by a cubed rock rather than a newline.
+        """
+        cubed_rock = Solver.symbols.CUBED_ROCKS.value.encode()
+        stride = width + 1
+        return b"".join(rocks[j::stride] + cubed_rock for j in range(width))
 
     @staticmethod
-    def tilt(
-        round_rocks: list[list[int]],
-        cubed_rocks: list[list[int]],
-        num_cols: int,
-        transpose: bool,
-        in_reverse: bool,
-    ) -> list[list[int]]:
-        """Tilts the map."""
-        num_rows = len(round_rocks)
-        new_round_rocks = [[] for _ in range(num_rows)]
-
-        if transpose:
-            round_rocks = Solver.transpose_row_list(round_rocks, num_cols)
-            cubed_rocks = Solver.transpose_row_list(cubed_rocks, num_cols)
-
-        for axis_value, (rounds, cubes) in enumerate(
-            zip(round_rocks, cubed_rocks)
-        ):
-            i = 0
-            last = -1
-            if in_reverse:
-                i = len(cubes) - 1
-                last = num_rows if transpose else num_cols
-                rounds = reversed(rounds)
-
-            for round in rounds:
-                if in_reverse:
-                    while i >= 0 and cubes[i] > round:
-                        last = cubes[i]
-                        i -= 1
-                    last -= 1
-                else:
-                    while i < len(cubes) and cubes[i] < round:
-                        last = cubes[i]
-                        i += 1
-                    last += 1
-
-                new_round_rocks[last if transpose else axis_value].append(
-                    axis_value if transpose else last
-                )
-
-        return new_round_rocks
+    def tilt(rocks: bytes, tilted: TiltedSegments) -> bytes:
+        """Tilt every line of the rocks along the line."""
+        cubed_rock = Solver.symbols.CUBED_ROCKS.value.encode()
+        return cubed_rock.join(
+            map(tilted.__getitem__, rocks.split(cubed_rock))
+        )
 
-    @staticmethod
-    def tilt_north(
-        round_rocks: list[list[int]],
-        cubed_rocks: list[list[int]],
-        num_cols: int,
-    ) -> list[list[int]]:
+    def tilt_north(self, grid: Grid, rocks: bytes) -> bytes:
         """Tilt the map north."""
-        return Solver.tilt(round_rocks, cubed_rocks, num_cols, True, False)
+        columns = self.transpose(rocks, grid.width)
+        columns = self.tilt(columns, self.tilted[0])
+        return self.transpose(columns, grid.height)
 
-    @staticmethod
-    def tilt_west(
-        round_rocks: list[list[int]],
-        cubed_rocks: list[list[int]],
-        num_cols: int,
-    ) -> list[list[int]]:
+    def tilt_west(self, _: Grid, rocks: bytes) -> bytes:
         """Tilt the map west."""
-        return Solver.tilt(round_rocks, cubed_rocks, num_cols, False, False)
+        return self.tilt(rocks, self.tilted[0])
 
-    @staticmethod
-    def tilt_south(
-        round_rocks: list[list[int]],
-        cubed_rocks: list[list[int]],
-        num_cols: int,
-    ) -> list[list[int]]:
+    def tilt_south(self, grid: Grid, rocks: bytes) -> bytes:
         """Tilt the map south."""
-        return Solver.tilt(round_rocks, cubed_rocks, num_cols, True, True)
+        columns = self.transpose(rocks, grid.width)
+        columns = self.tilt(columns, self.tilted[1])
+        return self.transpose(columns, grid.height)
 
-    @staticmethod
-    def tilt_east(
-        round_rocks: list[list[int]],
-        cubed_rocks: list[list[int]],
-        num_cols: int,
-    ) -> list[list[int]]:
+    def tilt_east(self, _: Grid, rocks: bytes) -> bytes:
         """Tilt the map east."""
-        return Solver.tilt(round_rocks, cubed_rocks, num_cols, False, True)
+        return self.tilt(rocks, self.tilted[1])
 
     @staticmethod
-    def row_list_to_key(graph: list[list[int]]) -> tuple[tuple[int, ...], ...]:
-        """Convert the graph to a hashable key."""
-        return tuple(tuple(row) for row in graph)
+    def get_rocks(grid: Grid) -> bytes:
+        """The rows of the grid, each ended by a cubed rock."""
+        return grid.data.replace(
+            b"\n", Solver.symbols.CUBED_ROCKS.value.encode()
+        )
 
     @staticmethod
-    def calculate_north_load(round_rocks: Sequence[Sequence[int]]) -> int:
+    def calculate_north_load(grid: Grid, rocks: bytes) -> int:
         """Calculate the total north load of the current round rock configuration."""
+        round_rock = Solver.symbols.ROUND_ROCKS.value.encode()
         return sum(
-            len(row) * (len(round_rocks) - i)
-            for i, row in enumerate(round_rocks)
+            rocks.count(round_rock, start, start + grid.width)
+            * (grid.height - i)
+            for i, start in enumerate(range(0, len(rocks), grid.stride))
         )
 
     def part_1(self) -> int:
         """Part 1 solver."""
-        round_rocks, cubed_rocks, num_cols = self.parse_file()
-
-        round_rocks = self.tilt_north(round_rocks, cubed_rocks, num_cols)
-        return self.calculate_north_load(round_rocks)
+        grid = self.parse_file()
+        rocks = self.tilt_north(grid, self.get_rocks(grid))
+        return self.calculate_north_load(grid, rocks)
 
     def part_2(self) -> int:
         """Part 2 solver."""
-        round_rocks, cubed_rocks, num_cols = self.parse_file()
+        grid = self.parse_file()
+        rocks = self.get_rocks(grid)
 
-        seen: dict[tuple[tuple[int, ...], ...], int] = {}
-        round_to_key: list[tuple[tuple[int, ...], ...]] = []
+        seen: dict[bytes, int] = {}
+        round_to_key: list[bytes] = []
         cycle = cycle_start = -1
 
         for k in range(1000000000):
-            key = self.row_list_to_key(round_rocks)
-            if key in seen:
-                cycle_start = seen[key]
-                cycle = k - seen[key]
+            if rocks in seen:
+                cycle_start = seen[rocks]
+                cycle = k - seen[rocks]
                 break
-            seen[key] = k
-            round_to_key.append(key)
+            seen[rocks] = k
+            round_to_key.append(rocks)
 
             for tilt in (
                 self.tilt_north,
@@ -187,14 +146,14 @@ class Solver:
                 self.tilt_south,
                 self.tilt_east,
             ):
-                round_rocks = tilt(round_rocks, cubed_rocks, num_cols)
+                rocks = tilt(grid, rocks)
 
         if cycle != -1 and cycle_start != -1:
-            round_rocks = round_to_key[
+            rocks = round_to_key[
                 cycle_start + (1000000000 - cycle_start) % cycle
             ]
 
-        return self.calculate_north_load(round_rocks)
+        return self.calculate_north_load(grid, rocks)
 
     def solve(self) -> None:
         """Runs part 1 and part 2."""
@@ -1,43 +1,35 @@
 """
 Day 15 solution.
 """
+import pathlib
+import re
 import sys
-from typing import Generator, Iterable
+from typing import Iterable
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.inputs import read_bytes  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
 
 
 class Solver:
     """Day 15 solver."""
 
+    STEP = re.compile(rb"([^-=]*)([-=])(\d*)")
+
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def sequence_generator(
-        self,
-    ) -> Generator[Generator[str, None, None], None, None]:
-        """Yields a generator of a sequence's tokens excluding the delimiter."""
-
-        def token_generator() -> Generator[str, None, None]:
-            nonlocal done
-            c = file.read(1)
-            while c not in [",", ""]:
-                yield c
-                c = file.read(1)
-
-            done = c == ""
-
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            done = False
-            while not done:
-                yield token_generator()
+    @parsed_input
+    def get_sequences(self) -> list[bytes]:
+        """Get the sequences excluding the delimiter."""
+        return read_bytes(self.filepath).strip().split(b",")
 
     @staticmethod
-    def get_hash_code(tokens: Iterable[str]) -> int:
+    def get_hash_code(tokens: Iterable[int]) -> int:
         """Calculate the hash code of the tokens."""
         total = 0
         for c in tokens:
-            total += ord(c)
+            total += c
             total *= 17
             total %= 256
         return total
@@ -46,33 +38,26 @@ class Solver:
         """Part 1 solver."""
         return sum(
             self.get_hash_code(sequence)
-            for sequence in self.sequence_generator()
+            for sequence in self.get_sequences()
         )
 
     def part_2(self) -> int:
         """Part 2 solver."""
-        REMOVE = "-"
-        REPLACE = "="
+        REMOVE = b"-"
+        REPLACE = b"="
 
         boxes = [{} for _ in range(256)]
-        for sequence in self.sequence_generator():
-            focal_length = 0
-            label = []
-            op = ""
-            for c in sequence:
-                if op != "":
-                    focal_length = focal_length * 10 + int(c)
-                elif c in (REMOVE, REPLACE):
-                    op = c
-                else:
-                    label.append(c)
+        for sequence in self.get_sequences():
+            match = self.STEP.fullmatch(sequence)
+            if match is None:
+                raise ValueError(f"Invalid step {sequence!r}.")
+            label, op, focal_length = match.groups()
             hash_code = self.get_hash_code(label)
-            label = "".join(label)
 
             if op == REMOVE:
                 boxes[hash_code].pop(label, None)
             elif op == REPLACE:
-                boxes[hash_code][label] = focal_length
+                boxes[hash_code][label] = int(focal_length)
 
         return sum(
             box_num * slot_num * focal_length
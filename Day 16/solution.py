@@ -1,12 +1,16 @@
 """
 Day 16 solution.
 """
-import collections
 import enum
+import pathlib
 import sys
 from multiprocessing import Pool
 from typing import Generator
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.grid import NEWLINE, Grid  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 16 solver."""
@@ -23,98 +27,104 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def get_grid(self) -> list[str]:
+    @parsed_input
+    def get_grid(self) -> Grid:
         """Parse the grid."""
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            return [line.strip() for line in file]
+        return Grid.from_file(self.filepath)
 
     @staticmethod
     def multiprocessing_get_num_energized_positions_wrapper(
-        args: tuple[list[str], int, int, int, int]
+        args: tuple[Grid, int, int]
     ) -> int:
         """Wrapper to unpack arguments for get_num_energized_positions."""
         return Solver.get_num_energized_positions(*args)
 
     @staticmethod
     def get_num_energized_positions(
-        grid: list[str], i: int, j: int, d_i: int, d_j: int
+        grid: Grid, index: int, offset: int
     ) -> int:
-        """Get the number of energized positions."""
-
-        def add_next(
-            stack: list[tuple[int, int, int, int]],
-            i: int,
-            j: int,
-            d_i: int,
-            d_j: int,
-        ):
-            c = grid[i][j]
-            if c == Solver.symbols.SPACE.value:
-                stack.append((i + d_i, j + d_j, d_i, d_j))
-            elif c == Solver.symbols.POSITIVE_MIRROR.value:
-                stack.append((i - d_j, j - d_i, -d_j, -d_i))
-            elif c == Solver.symbols.NEGATIVE_MIRROR.value:
-                stack.append((i + d_j, j + d_i, d_j, d_i))
-            elif c == Solver.symbols.VERTICAL_SPLITTER.value:
-                if d_i != 0:
-                    stack.append((i + d_i, j + d_j, d_i, d_j))
-                    return
-
-                stack.append((i + 1, j, 1, 0))
-                stack.append((i - 1, j, -1, 0))
-            elif c == Solver.symbols.HORIZONTAL_SPLITTER.value:
-                if d_j != 0:
-                    stack.append((i + d_i, j + d_j, d_i, d_j))
-                    return
-
-                stack.append((i, j + 1, 0, 1))
-                stack.append((i, j - 1, 0, -1))
-
-        energized = collections.defaultdict(set)
-        stack = [(i, j, d_i, d_j)]
+        """
+        Get the number of energized positions for a beam entering the flat
+        index moving by the flat offset.
+        """
+        north, east, south, west = grid.directions()
+        next_offsets = {
+            ord(Solver.symbols.POSITIVE_MIRROR.value): {
+                north: (east,),
+                east: (north,),
+                south: (west,),
+                west: (south,),
+            },
+            ord(Solver.symbols.NEGATIVE_MIRROR.value): {
+                north: (west,),
+                west: (north,),
+                south: (east,),
+                east: (south,),
+            },
+            ord(Solver.symbols.VERTICAL_SPLITTER.value): {
+                north: (north,),
+                south: (south,),
+                east: (north, south),
+                west: (north, south),
+            },
+            ord(Solver.symbols.HORIZONTAL_SPLITTER.value): {
+                east: (east,),
+                west: (west,),
+                north: (east, west),
+                south: (east, west),
+            },
+        }
+        direction_bits = {north: 1, east: 2, south: 4, west: 8}
+
+        data = grid.data
+        energized = bytearray(len(data))
+        stack = [(index, offset)]
         while stack:
-            i, j, d_i, d_j = stack.pop()
+            index, offset = stack.pop()
 
-            if not 0 <= i < len(grid) or not 0 <= j < len(grid[0]):
+            if not 0 <= index < len(data) or data[index] == NEWLINE:
                 continue
 
-            if (d_i, d_j) in energized[i, j]:
+            if energized[index] & direction_bits[offset]:
                 continue
 
-            energized[i, j].add((d_i, d_j))
-            add_next(stack, i, j, d_i, d_j)
+            energized[index] |= direction_bits[offset]
+            if data[index] in next_offsets:
+                for next_offset in next_offsets[data[index]][offset]:
+                    stack.append((index + next_offset, next_offset))
+            else:
+                stack.append((index + offset, offset))
 
-        return len(energized)
+        return len(energized) - energized.count(0)
 
     def part_1(self) -> int:
         """Part 1 solver."""
         grid = self.get_grid()
-        return self.get_num_energized_positions(grid, 0, 0, 0, 1)
+        return self.get_num_energized_positions(grid, 0, 1)
 
     def part_2(self) -> int:
         """Part 2 solver."""
         grid = self.get_grid()
+        north, east, south, west = grid.directions()
 
         def get_start_positions() -> (
-            Generator[tuple[list[str], int, int, int, int], None, None]
+            Generator[tuple[Grid, int, int], None, None]
         ):
             # Start from the left column and go right
-            for i in range(len(grid)):
-                yield grid, i, 0, 0, 1
+            for i in range(grid.height):
+                yield grid, grid.index(i, 0), east
 
             # Start from the right column and go left
-            for i, row in enumerate(grid):
-                yield grid, i, len(row) - 1, 0, -1
+            for i in range(grid.height):
+                yield grid, grid.index(i, grid.width - 1), west
 
             # Start from the top row and go down
-            for j in range(len(grid[0])):
-                yield grid, 0, j, 1, 0
+            for j in range(grid.width):
+                yield grid, grid.index(0, j), south
 
             # Start from the bottom row and go up
-            for j in range(len(grid[-1])):
-                yield grid, len(grid) - 1, j, -1, 0
+            for j in range(grid.width):
+                yield grid, grid.index(grid.height - 1, j), north
 
         with Pool() as pool:
             return max(
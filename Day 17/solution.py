@@ -2,8 +2,13 @@
 Day 17 solution.
 """
 import heapq
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.grid import NEWLINE, Grid  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 17 solver."""
@@ -11,54 +16,54 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def get_graph(self) -> list[list[int]]:
+    @parsed_input
+    def get_graph(self) -> Grid:
         """Parse the file and return the graph."""
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            return [[int(x) for x in line.strip()] for line in file]
+        return Grid.from_file(self.filepath)
 
     @staticmethod
     def generic_solve(
-        graph: list[list[int]],
+        graph: Grid,
         max_steps_without_turning: int,
         min_steps: int = 0,
     ) -> int:
         """Generic solver."""
-        m, n = len(graph), len(graph[0])
-        visited = [[[-1] * 2 for _ in range(n)] for _ in range(m)]
-        heap = [(0, (0, 0, 0)), (0, (0, 0, 1))]
+        data = graph.data
+        costs = data.translate(bytes((x - ord("0")) % 256 for x in range(256)))
+        target = graph.index(graph.height - 1, graph.width - 1)
+        axis_offsets = (graph.stride, 1)
+        visited = [[-1] * len(data) for _ in range(2)]
+        heap = [(0, 0, 0), (0, 0, 1)]
 
         while heap:
-            cost, (i, j, axis) = heapq.heappop(heap)
-            if (i, j) == (m - 1, n - 1):
+            cost, index, axis = heapq.heappop(heap)
+            if index == target:
                 return cost
 
-            for change in (-1, 1):
+            for change in (-axis_offsets[axis], axis_offsets[axis]):
                 next_cost = cost
-                next_i, next_j = i, j
+                next_index = index
                 for steps in range(1, max_steps_without_turning + 1):
-                    next_i += (axis == 0) * change
-                    next_j += (axis == 1) * change
+                    next_index += change
 
-                    if not 0 <= next_i < m or not 0 <= next_j < n:
+                    if (
+                        not 0 <= next_index < len(data)
+                        or data[next_index] == NEWLINE
+                    ):
                         break
-                    next_cost += graph[next_i][next_j]
+                    next_cost += costs[next_index]
                     if steps < min_steps:
                         continue
 
-                    next_state = next_i, next_j, 1 - axis
+                    next_visited = visited[1 - axis]
                     if (
-                        visited[next_i][next_j][1 - axis] != -1
-                        and visited[next_i][next_j][1 - axis] <= next_cost
+                        next_visited[next_index] != -1
+                        and next_visited[next_index] <= next_cost
                     ):
                         continue
 
-                    visited[next_i][next_j][1 - axis] = next_cost
-                    heapq.heappush(
-                        heap,
-                        (next_cost, next_state),
-                    )
+                    next_visited[next_index] = next_cost
+                    heapq.heappush(heap, (next_cost, next_index, 1 - axis))
 
         return -1
 
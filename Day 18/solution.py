@@ -1,9 +1,13 @@
 """
 Day 18 solution.
 """
+import pathlib
 import sys
 from typing import Generator
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 18 solver."""
@@ -43,18 +47,27 @@ class Solver:
         # https://en.wikipedia.org/wiki/Pick%27s_theorem#Formula
         return (abs(area) + edges) // 2 + 1
 
+    @parsed_input
+    def get_plan(self) -> list[tuple[str, str, str]]:
+        """Get the direction, length and colour of each instruction."""
+        with open(
+            self.filepath, "r", encoding=sys.getdefaultencoding()
+        ) as file:
+            return [
+                (direction, length, colour)
+                for direction, length, colour in (
+                    line.split() for line in file
+                )
+            ]
+
     def part_1(self) -> int:
         """Part 1 solver."""
 
         def instructions() -> (
             Generator[tuple[int, tuple[int, int]], None, None]
         ):
-            with open(
-                self.filepath, "r", encoding=sys.getdefaultencoding()
-            ) as file:
-                for line in file:
-                    direction, length, _ = line.split()
-                    yield int(length), self.LETTER_TO_DIRECTION[direction]
+            for direction, length, _ in self.get_plan():
+                yield int(length), self.LETTER_TO_DIRECTION[direction]
 
         return self.generic_solve(instructions())
 
@@ -64,14 +77,11 @@ class Solver:
         def instructions() -> (
             Generator[tuple[int, tuple[int, int]], None, None]
         ):
-            with open(
-                self.filepath, "r", encoding=sys.getdefaultencoding()
-            ) as file:
-                for line in file:
-                    instructions = line.split()[2][1:-1]
-                    yield int(instructions[1:6], 16), self.NUMBER_TO_DIRECTION[
-                        int(instructions[-1])
-                    ]
+            for *_, colour in self.get_plan():
+                instructions = colour[1:-1]
+                yield int(instructions[1:6], 16), self.NUMBER_TO_DIRECTION[
+                    int(instructions[-1])
+                ]
 
         return self.generic_solve(instructions())
 
@@ -1,10 +1,13 @@
 """
 Day 19 solution.
 """
+import pathlib
 import sys
-from io import TextIOWrapper
 from typing import Callable, Iterable
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 Workflow = dict[str, list[tuple[str, str, int, str]]]
 
 
@@ -22,10 +25,11 @@ class Solver:
             result *= x
         return result
 
-    def generic_solve(
-        self, solve: Callable[[Workflow, TextIOWrapper], int]
-    ) -> int:
-        """Generic solve."""
+    @parsed_input
+    def get_workflow_and_ratings(
+        self,
+    ) -> tuple[Workflow, list[dict[str, int]]]:
+        """Parse the file to get the workflow and each part's ratings."""
         workflow: Workflow = {}
         with open(
             self.filepath, "r", encoding=sys.getdefaultencoding()
@@ -53,20 +57,29 @@ class Solver:
                         (variable_name, operation, int(value), target)
                     )
 
-            return solve(workflow, file)
-
-    def part_1(self) -> int:
-        """Part 1 solver."""
-
-        def solve(workflow: Workflow, file: TextIOWrapper) -> int:
-            total = 0
-            operations = {">": lambda a, b: a > b, "<": lambda a, b: a < b}
+            ratings = []
             for line in file:
                 values = {}
                 for statements in line.strip()[1:-1].split(","):
                     variable_name, value = statements.split("=")
                     values[variable_name] = int(value)
+                ratings.append(values)
 
+        return workflow, ratings
+
+    def generic_solve(
+        self, solve: Callable[[Workflow, list[dict[str, int]]], int]
+    ) -> int:
+        """Generic solve."""
+        return solve(*self.get_workflow_and_ratings())
+
+    def part_1(self) -> int:
+        """Part 1 solver."""
+
+        def solve(workflow: Workflow, ratings: list[dict[str, int]]) -> int:
+            total = 0
+            operations = {">": lambda a, b: a > b, "<": lambda a, b: a < b}
+            for values in ratings:
                 current = "in"
                 while current not in ["A", "R"]:
                     for variable_name, operation, value, target in workflow[
@@ -88,7 +101,7 @@ class Solver:
     def part_2(self) -> int:
         """Part 2 solver."""
 
-        def solve(workflow: Workflow, _: TextIOWrapper) -> int:
+        def solve(workflow: Workflow, _: list[dict[str, int]]) -> int:
             def get_new_ranges(
                 low: int, high: int, value: int, operation: str
             ) -> tuple[tuple[int, int], tuple[int, int]]:
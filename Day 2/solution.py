@@ -1,80 +1,135 @@
 """
 Day 2 solution.
 """
+import array
+import bisect
+import itertools
+import operator
+import pathlib
+import re
 import sys
-from typing import Generator
+from typing import Iterable, Sequence
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.inputs import read_bytes  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
+COLOURS = (b"red", b"green", b"blue")
+
+
+class Games:
+    """
+    Columnar store of the games, with each game's id and the most balls of
+    each colour drawn at once.
+    """
+
+    __slots__ = ("ids", "maxima")
+
+    def __init__(
+        self, ids: array.array, maxima: tuple[array.array, ...]
+    ) -> None:
+        self.ids = ids
+        self.maxima = maxima
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def scan(self, limits: Sequence[int]) -> int:
+        """The sum of the ids of the games possible within the limits."""
+        possible = [
+            [maximum <= limit for maximum in column]
+            for column, limit in zip(self.maxima, limits)
+        ]
+        return sum(itertools.compress(self.ids, map(all, zip(*possible))))
+
+    def prefix_sums(self) -> tuple[list[list[int]], list[int]]:
+        """
+        The distinct maxima of each colour and the sum of the ids of the
+        games with every maximum at or below each combination of them.
+        """
+        levels = [sorted(set(column)) for column in self.maxima]
+        red, green, blue = map(len, levels)
+        table = [0] * (red * green * blue)
+        for game_id, *maxima in zip(self.ids, *self.maxima):
+            i, j, k = (
+                bisect.bisect_left(level, maximum)
+                for level, maximum in zip(levels, maxima)
+            )
+            table[(i * green + j) * blue + k] += game_id
+
+        # Accumulate along each axis in turn
+        for stride, size in ((green * blue, red), (blue, green), (1, blue)):
+            for index in range(len(table)):
+                if index // stride % size:
+                    table[index] += table[index - stride]
+        return levels, table
+
+    def possible_id_sums(self, limits: Iterable[Sequence[int]]) -> list[int]:
+        """
+        The sum of the ids of the games possible within each of the limits,
+        given as the most red, green and blue balls allowed.
+
+        Many limits are answered from a table of prefix sums over the
+        distinct maxima rather than by scanning every game.
+        """
+        limits = list(limits)
+        table_size = 1
+        for column in self.maxima:
+            table_size *= len(set(column))
+        if len(limits) * len(self) <= table_size:
+            return [self.scan(limit) for limit in limits]
+
+        levels, table = self.prefix_sums()
+        _, green, blue = map(len, levels)
+        result = []
+        for limit in limits:
+            i, j, k = (
+                bisect.bisect_right(level, bound) - 1
+                for level, bound in zip(levels, limit)
+            )
+            result.append(
+                table[(i * green + j) * blue + k] if min(i, j, k) >= 0 else 0
+            )
+        return result
+
+    def powers(self) -> Iterable[int]:
+        """The product of the maxima of each game."""
+        red, green, blue = self.maxima
+        return map(operator.mul, map(operator.mul, red, green), blue)
 
 
 class Solver:
     """Day 2 solver."""
 
+    max_colours = (12, 13, 14)
+    patterns = [re.compile(rb"(\d+) " + colour) for colour in COLOURS]
+
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def decode_line(self, line: str) -> tuple[int, list[str]]:
+    @parsed_input
+    def get_games(self) -> Games:
         """
-        Decode line to get game id and draw details for the game.
+        Get the game id and the most balls of each colour drawn in a game.
         """
-        game_detail, draw_details = line.split(":")
-        return (int(game_detail.split()[-1]), draw_details.split(";"))
-
-    def decode_draw(
-        self, game_set: str
-    ) -> Generator[tuple[int, int], None, None]:
-        """
-        Decodes set details to a list of colour id, number of colour pairs.
-        """
-        for ball_details in game_set.split(", "):
-            num_token, colour_token = ball_details.split()
-            yield int(
-                num_token
-            ), 0 if colour_token == "red" else 1 if colour_token == "green" else 2
+        ids = array.array("q")
+        maxima = tuple(array.array("q") for _ in COLOURS)
+        for line in read_bytes(self.filepath).splitlines():
+            game, _, draws = line.partition(b":")
+            if not draws:
+                continue
+            ids.append(int(game.split()[-1]))
+            for column, pattern in zip(maxima, self.patterns):
+                column.append(max(map(int, pattern.findall(draws)), default=0))
+        return Games(ids, maxima)
 
     def part_1(self):
         """Part 1 solver."""
-        max_colours = [12, 13, 14]
-
-        def all_draws_less_than_max(draws: list[str]) -> bool:
-            def draw_less_than_max(draw: str) -> bool:
-                return all(
-                    num <= max_colours[colour]
-                    for num, colour in self.decode_draw(draw)
-                )
-
-            return all(draw_less_than_max(draw) for draw in draws)
-
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            return sum(
-                game_id
-                for game_id, draws in (self.decode_line(line) for line in file)
-                if all_draws_less_than_max(draws)
-            )
+        return self.get_games().possible_id_sums([self.max_colours])[0]
 
     def part_2(self):
         """Part 2 solver."""
-
-        def get_min_colours(draws: list[str]) -> list[int]:
-            colours = [0, 0, 0]
-            for draw in draws:
-                for num, colour in self.decode_draw(draw):
-                    colours[colour] = max(colours[colour], num)
-            return colours
-
-        def multiply(colours: list[int]) -> int:
-            result = 1
-            for x in colours:
-                result *= x
-            return result
-
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            return sum(
-                multiply(get_min_colours(draws))
-                for _, draws in (self.decode_line(line) for line in file)
-            )
+        return sum(self.get_games().powers())
 
     def solve(self) -> None:
         """Runs part 1 and part 2."""
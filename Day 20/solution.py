@@ -6,8 +6,12 @@ from __future__ import annotations
 import collections
 import enum
 import math
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 20 solver."""
@@ -28,21 +32,13 @@ class Solver:
         LOW_PULSE = False
         HIGH_PULSE = True
 
-    def parse_file(
+    @parsed_input
+    def parse_network(
         self,
-    ) -> tuple[
-        dict[str, list[str]],
-        dict[str, str],
-        dict[str, bool],
-        dict[str, dict[str, bool]],
-    ]:
-        """Parse the file to get the module outputs, types, state and input values."""
+    ) -> tuple[dict[str, list[str]], dict[str, str]]:
+        """Parse the file to get the module outputs and types."""
         modules_outputs: dict[str, list[str]] = {}
         modules_type: dict[str, str] = {}
-        modules_state: dict[str, bool] = collections.defaultdict(bool)
-        modules_inputs: dict[str, dict[str, bool]] = collections.defaultdict(
-            lambda: collections.defaultdict(bool)
-        )
 
         with open(
             self.filepath, "r", encoding=sys.getdefaultencoding()
@@ -58,13 +54,34 @@ class Solver:
                     module = module[1:]
                     modules_type[module] = module_type
 
-                for output in outputs:
-                    modules_inputs[output][
-                        module
-                    ] = self.pulse_types.LOW_PULSE.value
-                modules_state[module] = self.pulse_types.LOW_PULSE.value
                 modules_outputs[module] = outputs
 
+        return modules_outputs, modules_type
+
+    def parse_file(
+        self,
+    ) -> tuple[
+        dict[str, list[str]],
+        dict[str, str],
+        dict[str, bool],
+        dict[str, dict[str, bool]],
+    ]:
+        """
+        Get the module outputs, types and fresh state and input values.
+        """
+        modules_outputs, modules_type = self.parse_network()
+        modules_state: dict[str, bool] = collections.defaultdict(bool)
+        modules_inputs: dict[str, dict[str, bool]] = collections.defaultdict(
+            lambda: collections.defaultdict(bool)
+        )
+
+        for module, outputs in modules_outputs.items():
+            for output in outputs:
+                modules_inputs[output][
+                    module
+                ] = self.pulse_types.LOW_PULSE.value
+            modules_state[module] = self.pulse_types.LOW_PULSE.value
+
         return modules_outputs, modules_type, modules_state, modules_inputs
 
     @staticmethod
@@ -1,10 +1,14 @@
 """
 Day 21 solution.
 """
-import collections
 import itertools
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.grid import Grid  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 21 solver."""
@@ -12,93 +16,56 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def get_graph(self) -> tuple[list[str], tuple[int, int]]:
-        """Get the graph from the input file."""
-        graph = []
-        start = -1, -1
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            for i, line in enumerate(file):
-                graph.append(line.strip())
-                try:
-                    start = i, line.index("S")
-                except ValueError:
-                    pass
-        return graph, start
+    @parsed_input
+    def get_graph(self) -> tuple[Grid, int, int]:
+        """
+        Get the graph from the input file with masks of the start position
+        and of the garden plots.
+        """
+        grid = Grid.from_file(self.filepath)
+        return grid, grid.mask("S"), grid.cells & ~grid.mask("#")
 
     @staticmethod
-    def step(
-        graph: list[str],
-        queue: collections.deque[tuple[int, int]],
-        visited: set[tuple[int, int]],
-    ) -> None:
-        """Simulate one step."""
-        visited.clear()
-
-        for _ in range(len(queue)):
-            i, j = queue.popleft()
-            for d_i, d_j in itertools.pairwise((0, -1, 0, 1, 0)):
-                n_i, n_j = i + d_i, j + d_j
-                if (
-                    not 0 <= n_i < len(graph)
-                    or not 0 <= n_j < len(graph[0])
-                    or graph[n_i][n_j] == "#"
-                    or (n_i, n_j) in visited
-                ):
-                    continue
-
-                visited.add((n_i, n_j))
-                queue.append((n_i, n_j))
+    def step(graph: Grid, plots: int, positions: int) -> int:
+        """Simulate one step, returning the mask of the next positions."""
+        next_positions = 0
+        for d_i, d_j in itertools.pairwise((0, -1, 0, 1, 0)):
+            next_positions |= graph.shift(positions, d_i, d_j)
+        return next_positions & plots
 
     def part_1(self) -> int:
         """Part 1 solver."""
-        graph, start = self.get_graph()
-
-        queue = collections.deque([start])
-        visited = set()
+        graph, positions, plots = self.get_graph()
 
         for _ in range(64):
-            self.step(graph, queue, visited)
-        return len(visited)
+            positions = self.step(graph, plots, positions)
+        return positions.bit_count()
 
     def part_2(self) -> int:
         """Part 2 solver."""
-        graph, start = self.get_graph()
+        graph, start, plots = self.get_graph()
 
-        m, n = len(graph), len(graph[0])
+        m = graph.height
         target_step = 26501365
 
         # See https://www.reddit.com/r/adventofcode/comments/18nevo3/comment/keam21w
         # for a better explanation
         # Find all positions that can be reached
-        queue = collections.deque([start])
-        reachable = {start}
-        while queue:
-            i, j = queue.popleft()
-            for d_i, d_j in itertools.pairwise((0, -1, 0, 1, 0)):
-                n_i, n_j = i + d_i, j + d_j
-                if (
-                    not 0 <= n_i < m
-                    or not 0 <= n_j < n
-                    or graph[n_i][n_j] == "#"
-                    or (n_i, n_j) in reachable
-                ):
-                    continue
-                reachable.add((n_i, n_j))
-                queue.append((n_i, n_j))
+        reachable = start
+        while (
+            next_reachable := reachable | self.step(graph, plots, reachable)
+        ) != reachable:
+            reachable = next_reachable
 
         # Find the inner diamond positions
-        queue = collections.deque([start])
-        visited = set()
+        positions = start
         for _ in range(target_step % m):
-            self.step(graph, queue, visited)
-        inner_odd_positions = set(visited)
-        self.step(graph, queue, visited)
-        inner_even_positions = set(visited)
+            positions = self.step(graph, plots, positions)
+        inner_odd_positions = positions
+        inner_even_positions = self.step(graph, plots, positions)
 
         outer_positions = (
-            reachable - inner_even_positions - inner_odd_positions
+            reachable & ~inner_even_positions & ~inner_odd_positions
         )
 
         num_repeats = (
@@ -109,9 +76,11 @@ class Solver:
         )
 
         return (
-            num_odd_tiles * num_odd_tiles * len(inner_odd_positions)
-            + num_odd_tiles * num_even_tiles * len(outer_positions)
-            + num_even_tiles * num_even_tiles * len(inner_even_positions)
+            num_odd_tiles * num_odd_tiles * inner_odd_positions.bit_count()
+            + num_odd_tiles * num_even_tiles * outer_positions.bit_count()
+            + num_even_tiles
+            * num_even_tiles
+            * inner_even_positions.bit_count()
         )
 
     def solve(self) -> None:
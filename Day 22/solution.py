@@ -4,8 +4,12 @@ Day 22 solution.
 import collections
 import heapq
 import itertools
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 X = int
 Y = int
 Z = int
@@ -21,6 +25,7 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
+    @parsed_input
     def get_resting_bricks(
         self,
     ) -> tuple[list[tuple[XYZ, XYZ]], dict[XYZ, int]]:
@@ -86,6 +91,13 @@ class Solver:
 
         return resting_bricks, blocks_to_id
 
+    @parsed_input
+    def get_support_graphs(self) -> tuple[list[set[int]], list[set[int]]]:
+        """Get the directional support graphs of the resting bricks."""
+        return self.create_directional_support_graphs(
+            *self.get_resting_bricks()
+        )
+
     @staticmethod
     def create_directional_support_graphs(
         resting_bricks: list[tuple[XYZ, XYZ]], blocks_to_id: dict[XYZ, int]
@@ -111,11 +123,7 @@ class Solver:
 
     def part_1(self) -> int:
         """Part 1 solver."""
-        resting_bricks, blocks_to_id = self.get_resting_bricks()
-
-        supports, supported_by = self.create_directional_support_graphs(
-            resting_bricks, blocks_to_id
-        )
+        supports, supported_by = self.get_support_graphs()
 
         return sum(
             all(
@@ -127,11 +135,7 @@ class Solver:
 
     def part_2(self) -> int:
         """Part 2 solver."""
-        resting_bricks, blocks_to_id = self.get_resting_bricks()
-
-        supports, supported_by = self.create_directional_support_graphs(
-            resting_bricks, blocks_to_id
-        )
+        supports, supported_by = self.get_support_graphs()
 
         def count_falling_bricks(supported_bricks: set[int]) -> int:
             stack = [
@@ -1,10 +1,13 @@
 """
 Day 23 solution.
 """
-import collections
-import itertools
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.grid import Grid  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 23 solver."""
@@ -12,100 +15,89 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
+    @parsed_input
+    def get_grid(self) -> Grid:
+        """Parse the file to get the grid."""
+        return Grid.from_file(self.filepath)
+
     def get_graph(
         self, ignore_slopes: bool
-    ) -> tuple[
-        dict[tuple[int, int], dict[tuple[int, int], int]], tuple[int, int]
-    ]:
+    ) -> tuple[dict[int, dict[int, int]], int]:
         """
-        Parse the file and get a compressed graph with the number of rows
-        and columns respectively.
+        Get a compressed graph of the grid, keyed by flat index, with the
+        flat index of the start.
         """
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            grid = [line.strip() for line in file]
-
-        slopes = "<^>v"
-        graph: dict[
-            tuple[int, int], dict[tuple[int, int], int]
-        ] = collections.defaultdict(dict)
-        for i, row in enumerate(grid):
-            for j, x in enumerate(row):
-                if x == "#":
-                    continue
-
-                for slope_type, (d_i, d_j) in zip(
-                    slopes, itertools.pairwise((0, -1, 0, 1, 0))
-                ):
-                    if (
-                        not ignore_slopes
-                        and grid[i][j] in slopes
-                        and grid[i][j] != slope_type
-                    ):
-                        continue
-
-                    n_i, n_j = i + d_i, j + d_j
-                    try:
-                        if grid[n_i][n_j] == "#":
-                            continue
-                    except IndexError:
-                        continue
-
-                    graph[i, j][n_i, n_j] = 1
-
-        done = False
-        while not done:
-            done = True
-            for node, neighbours in graph.items():
-                if len(neighbours) != 2:
-                    continue
-
-                a, b = neighbours
-                try:
-                    graph[a].pop(node)
-                    graph[a][b] = neighbours[a] + neighbours[b]
-                except KeyError:
-                    # Edge is unidirectional i.e. only node -> a
-                    pass
-
-                try:
-                    graph[b].pop(node)
-                    graph[b][a] = neighbours[a] + neighbours[b]
-                except KeyError:
-                    # Edge is unidirectional i.e. only node -> b
-                    pass
-
-                graph.pop(node)
-                done = False
-                break
-
-        return graph, (len(grid), len(grid[0]))
+        grid = self.get_grid()
+        data = grid.data
+        slopes = dict(zip(b"^>v<", grid.directions()))
+
+        def next_indices(index: int) -> list[int]:
+            if not ignore_slopes and data[index] in slopes:
+                offsets = [slopes[data[index]]]
+            else:
+                offsets = list(grid.directions())
+            return [
+                index + offset
+                for offset in offsets
+                if grid.in_bounds(index + offset)
+                and data[index + offset] != ord("#")
+            ]
+
+        # Junctions are the start, the last row and every fork
+        start = grid.find(".")
+        last_row = grid.index(grid.height - 1, 0)
+        junctions = {start} | {
+            index
+            for index in grid.find_all(".<^>v")
+            if index >= last_row
+            or sum(data[n] != ord("#") for n in grid.neighbours(index)) > 2
+        }
+
+        graph: dict[int, dict[int, int]] = {node: {} for node in junctions}
+        for node in junctions:
+            for index in next_indices(node):
+                previous, steps = node, 1
+                while index not in junctions:
+                    following = [
+                        n for n in next_indices(index) if n != previous
+                    ]
+                    if len(following) != 1:
+                        break
+                    previous, index = index, following[0]
+                    steps += 1
+                else:
+                    graph[node][index] = max(
+                        graph[node].get(index, 0), steps
+                    )
+
+        return graph, start
 
     def generic_solve(self, ignore_slopes: bool) -> int:
         """Generic solve."""
-        graph, (m, n) = self.get_graph(ignore_slopes)
+        graph, start = self.get_graph(ignore_slopes)
+        grid = self.get_grid()
+        last_row = grid.index(grid.height - 1, 0)
 
-        stack: list[tuple[int, int, int]] = [(0, 1, 0)]
-        visited: list[list[bool]] = [[False] * n for _ in range(m)]
+        stack: list[tuple[int, int]] = [(start, 0)]
+        visited = bytearray(len(grid))
         result = 0
         while stack:
-            i, j, total = stack.pop()
+            node, total = stack.pop()
             if total == -1:
-                visited[i][j] = False
+                visited[node] = 0
                 continue
 
-            if i == m - 1:
+            if node >= last_row:
                 result = max(result, total)
                 continue
 
-            visited[i][j] = True
-            stack.append((i, j, -1))
-            for (n_i, n_j), cost in graph[i, j].items():
-                if visited[n_i][n_j]:
+            visited[node] = 1
+            stack.append((node, -1))
+            for next_node, cost in graph[node].items():
+                if visited[next_node]:
                     continue
 
-                stack.append((n_i, n_j, total + cost))
+                stack.append((next_node, total + cost))
 
         return result
 
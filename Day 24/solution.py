@@ -2,8 +2,12 @@
 Day 24 solution.
 """
 import itertools
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 24 solver."""
@@ -11,6 +15,7 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
+    @parsed_input
     def get_hailstones(
         self,
     ) -> list[tuple[tuple[int, int, int], tuple[int, int, int]]]:
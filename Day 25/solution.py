@@ -2,8 +2,12 @@
 Day 25 solution.
 """
 import collections
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 25 solver."""
@@ -11,17 +15,24 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def part_1(self) -> int:
-        """Part 1 solver."""
-        graph = collections.defaultdict(dict)
+    @parsed_input
+    def get_connections(self) -> list[tuple[str, list[str]]]:
+        """Get each component and the components it is connected to."""
         with open(
             self.filepath, "r", encoding=sys.getdefaultencoding()
         ) as file:
-            for line in file:
-                source, rest = line.split(": ")
-                for next_ in rest.split():
-                    graph[source][next_] = 1
-                    graph[next_][source] = 1
+            return [
+                (source, rest.split())
+                for source, rest in (line.split(": ") for line in file)
+            ]
+
+    def part_1(self) -> int:
+        """Part 1 solver."""
+        graph = collections.defaultdict(dict)
+        for source, connections in self.get_connections():
+            for next_ in connections:
+                graph[source][next_] = 1
+                graph[next_][source] = 1
 
         # See details at:
         # https://www.reddit.com/r/adventofcode/comments/18qbsxs/comment/keuadf5
@@ -1,145 +1,190 @@
 """
 Day 3 solution.
 """
+import array
+import bisect
 import itertools
+import math
+import pathlib
+import re
 import sys
-from typing import Callable, Generator, Iterable
+from typing import Iterator
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.grid import Grid  # pylint: disable=wrong-import-position
+from aoc2023.inputs import lines  # pylint: disable=wrong-import-position
+from aoc2023.inputs import open_input  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
+NUMBER = re.compile(rb"\d+")
+SYMBOL = re.compile(rb"[^\d. ]")
+
+Row = tuple[list[int], list[int], list[int], int, list[int]]
+"""
+The starts, ends and values of the numbers in a row, a bitmask of the
+columns with a symbol and the columns of the stars.
+"""
+EMPTY_ROW: Row = ([], [], [], 0, [])
 
 
 class Solver:
     """Day 3 solver."""
 
+    gear_arity = 2
+    """The number of part numbers next to a star that make it a gear."""
+    streaming = True
+    """Whether to stream the rows rather than label the whole grid."""
+
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
-
-    def get_nums_and_symbols(
-        self, is_valid_symbol: Callable[[str], bool]
-    ) -> tuple[
-        list[tuple[int, int]],
-        dict[tuple[int, int], int],
-        list[list[tuple[int, int]]],
-        list[int],
-    ]:
+        self.sums: tuple[int, int] | None = None
+
+    @staticmethod
+    def check_arity(arity: int) -> None:
+        """Check a gear needs at least one part number."""
+        if arity < 1:
+            raise ValueError(
+                f"Expected a gear arity of at least 1, got {arity}."
+            )
+
+    @staticmethod
+    def parse_row(line: bytes | memoryview) -> Row:
+        """Parse the numbers and symbols of a row."""
+        starts, ends, values = [], [], []
+        for match in NUMBER.finditer(line):
+            starts.append(match.start())
+            ends.append(match.end())
+            values.append(int(match[0]))
+
+        symbols = 0
+        stars = []
+        for match in SYMBOL.finditer(line):
+            symbols |= 1 << match.start()
+            if match[0] == b"*":
+                stars.append(match.start())
+        return starts, ends, values, symbols, stars
+
+    @staticmethod
+    def row_sums(
+        previous: Row, current: Row, following: Row, arity: int = 2
+    ) -> tuple[int, int]:
+        """
+        The sum of the part numbers and of the gear ratios of the current
+        row, given the rows around it.
+        """
+        starts, ends, values, _, stars = current
+        symbols = previous[3] | current[3] | following[3]
+        part_sum = 0
+        for start, end, value in zip(starts, ends, values):
+            low = max(start - 1, 0)
+            if symbols >> low & ((1 << (end + 1 - low)) - 1):
+                part_sum += value
+
+        gear_sum = 0
+        for column in stars:
+            adjacent = []
+            for row_starts, row_ends, row_values, _, _ in (
+                previous,
+                current,
+                following,
+            ):
+                # Numbers in a row are disjoint, so both bounds are sorted
+                first = bisect.bisect_left(row_ends, column)
+                last = bisect.bisect_right(row_starts, column + 1)
+                adjacent.extend(row_values[first:last])
+            if len(adjacent) == arity:
+                gear_sum += math.prod(adjacent)
+        return part_sum, gear_sum
+
+    def scan_rows(self, arity: int = 2) -> Iterator[tuple[int, int]]:
         """
-        Get all the valid symbol positions and number positions.
+        Stream the schematic, yielding the sum of the part numbers and of
+        the gear ratios of each row. Only three rows are kept at a time.
+        """
+        self.check_arity(arity)
+        with open_input(self.filepath) as data:
+            previous, current = EMPTY_ROW, None
+            for row in map(self.parse_row, lines(data)):
+                if current is not None:
+                    yield self.row_sums(previous, current, row, arity)
+                    previous = current
+                current = row
+            if current is not None:
+                yield self.row_sums(previous, current, EMPTY_ROW, arity)
+
+    def stream_sums(self, arity: int = 2) -> tuple[int, int]:
+        """The sum of the part numbers and of the gear ratios, streamed."""
+        part_sum = gear_sum = 0
+        for row_part_sum, row_gear_sum in self.scan_rows(arity):
+            part_sum += row_part_sum
+            gear_sum += row_gear_sum
+        return part_sum, gear_sum
+
+    @parsed_input
+    def parse_schematic(self) -> tuple[Grid, array.array, list[int]]:
+        """
+        Parse the schematic for the grid, the label of every flat index and
+        the number of each label.
+
+        Labels are -1 where there is no number, and the label array is
+        padded past the end of the grid so the flat indices around any cell,
+        including negative ones, are valid.
         """
-        symbols = []
-        positions_to_id = {}
-        id_to_positions = []
-        id_to_num = []
-
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            for i, line in enumerate(file):
-                num = -1
-                num_digits = 0
-                line = line.strip()
-                for j, c in enumerate(line):
-                    if c.isdigit():
-                        if num == -1:
-                            num = 0
-                        num = num * 10 + int(c)
-                        num_digits += 1
-                        continue
-
-                    if num != -1:
-                        id_to_positions.append([])
-                        for d_j in range(1, num_digits + 1):
-                            position = (i, j - d_j)
-                            positions_to_id[position] = len(id_to_num)
-                            id_to_positions[-1].append(position)
-                        id_to_num.append(num)
-
-                    num = -1
-                    num_digits = 0
-
-                    if is_valid_symbol(c):
-                        symbols.append((i, j))
-
-                if num != -1:
-                    id_to_positions.append([])
-                    for d_j in range(1, num_digits + 1):
-                        position = (i, len(line) - 1 - d_j)
-                        positions_to_id[position] = len(id_to_num)
-                        id_to_positions[-1].append(position)
-                    id_to_num.append(num)
-
-        return symbols, positions_to_id, id_to_positions, id_to_num
-
-    def get_adjacent_points(
-        self, i: int, j: int
-    ) -> Generator[tuple[int, int], None, None]:
+        grid = Grid.from_file(self.filepath)
+        labels = array.array("i", [-1]) * (len(grid) + grid.stride + 1)
+        values = []
+        for match in re.finditer(rb"\d+", grid.data):
+            labels[match.start() : match.end()] = array.array(
+                "i", [len(values)]
+            ) * len(match[0])
+            values.append(int(match[0]))
+        return grid, labels, values
+
+    def label_sums(self, arity: int = 2) -> tuple[int, int]:
         """
-        Yields adjacent points.
+        The sum of the part numbers and of the gear ratios, from the whole
+        grid's labels and masks.
         """
-        for d_i, d_j in itertools.product([-1, 0, 1], repeat=2):
-            if d_i == d_j == 0:
-                continue
-            yield i + d_i, j + d_j
+        self.check_arity(arity)
+        grid, labels, values = self.parse_schematic()
+        digits = grid.mask("0123456789")
+        symbols = grid.cells & ~digits & ~grid.mask(". ")
+        part_labels = {
+            labels[index]
+            for index in grid.indices(digits & grid.dilate(symbols))
+        }
+        part_sum = sum(values[label] for label in part_labels)
+
+        window = [
+            grid.index(d_i, d_j)
+            for d_i, d_j in itertools.product((-1, 0, 1), repeat=2)
+        ]
+        gear_sum = 0
+        stars = grid.mask("*") & grid.dilate(digits)
+        for index in grid.indices(stars):
+            adjacent = {labels[index + offset] for offset in window}
+            adjacent.discard(-1)
+            if len(adjacent) == arity:
+                gear_sum += math.prod(values[label] for label in adjacent)
+        return part_sum, gear_sum
+
+    def get_sums(self) -> tuple[int, int]:
+        """The answers to both parts, from a single pass."""
+        if self.sums is None:
+            self.sums = (
+                self.stream_sums(self.gear_arity)
+                if self.streaming
+                else self.label_sums(self.gear_arity)
+            )
+        return self.sums
 
     def part_1(self):
         """Part 1 solver."""
-        (
-            symbols,
-            positions_to_id,
-            id_to_positions,
-            id_to_num,
-        ) = self.get_nums_and_symbols(lambda x: x not in [".", " "])
-
-        def sum_unique_adjacent_nums(i: int, j: int) -> int:
-            result = 0
-
-            for adjacent_point in self.get_adjacent_points(i, j):
-                if adjacent_point not in positions_to_id:
-                    continue
-                num_id = positions_to_id[adjacent_point]
-                num = id_to_num[num_id]
-                result += num
-
-                # Remove all other the number positions from the dictionary.
-                for position in id_to_positions[num_id]:
-                    positions_to_id.pop(position)
-            return result
-
-        return sum(sum_unique_adjacent_nums(i, j) for i, j in symbols)
+        return self.get_sums()[0]
 
     def part_2(self):
         """Part 2 solver."""
-        stars, positions_to_id, _, id_to_num = self.get_nums_and_symbols(
-            lambda x: x == "*"
-        )
-
-        def get_unique_part_numbers(position: tuple[int, int]) -> set[int]:
-            return {
-                positions_to_id[next_position]
-                for next_position in self.get_adjacent_points(*position)
-                if next_position in positions_to_id
-            }
-
-        def get_valid_part_numbers_generator() -> (
-            Generator[set[int], None, None]
-        ):
-            for position in stars:
-                part_numbers = get_unique_part_numbers(position)
-                if len(part_numbers) == 2:
-                    yield part_numbers
-
-        def convert_id_to_num(
-            ids: Iterable[int],
-        ) -> Generator[int, None, None]:
-            return (id_to_num[num_id] for num_id in ids)
-
-        def product(nums: Iterable[int]) -> int:
-            result = 1
-            for x in nums:
-                result *= x
-            return result
-
-        return sum(
-            product(convert_id_to_num(adjacent_nums))
-            for adjacent_nums in get_valid_part_numbers_generator()
-        )
+        return self.get_sums()[1]
 
     def solve(self) -> None:
         """Runs part 1 and part 2."""
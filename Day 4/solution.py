@@ -1,8 +1,12 @@
 """
 Day 4 solution.
 """
+import pathlib
 import sys
-from collections import deque
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.inputs import read_bytes  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
 
 
 class Solver:
@@ -11,63 +15,44 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def parse_line(self, line: str) -> tuple[set[str], list[str]]:
-        """
-        Parse line for the winning numbers and the received numbers
-        """
-        game_details = line.split(":")[1]
-        winning_nums, received_nums = game_details.split("|")
-        return set(winning_nums.split()), received_nums.split()
+    @parsed_input
+    def get_match_counts(self) -> list[int]:
+        """The number of received numbers that win, for every card."""
+        match_counts = []
+        for line in read_bytes(self.filepath).splitlines():
+            _, _, numbers = line.partition(b":")
+            if not numbers:
+                continue
+            winning, _, received = numbers.partition(b"|")
+            match_counts.append(
+                len(set(winning.split()).intersection(received.split()))
+            )
+        return match_counts
 
     def part_1(self):
         """Part 1 solver."""
-
-        def score_line(line: str) -> int:
-            result = 0
-            winning_numbers, gotten_numbers = self.parse_line(line)
-            for num in gotten_numbers:
-                if num not in winning_numbers:
-                    continue
-
-                if result == 0:
-                    result = 1
-                else:
-                    result *= 2
-            return result
-
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            return sum(score_line(line) for line in file)
+        return sum(
+            1 << (matches - 1)
+            for matches in self.get_match_counts()
+            if matches
+        )
 
     def part_2(self):
         """Part 2 solver."""
-
-        def calculate_extra_cards(line: str, extra_cards: deque) -> int:
-            winning_numbers, gotten_numbers = self.parse_line(line)
-            current_number_cards = (
-                0 if not extra_cards else extra_cards.popleft()
-            ) + 1
-
-            number_matching = sum(
-                1 for num in gotten_numbers if num in winning_numbers
-            )
-
-            for i in range(number_matching):
-                if len(extra_cards) == i:
-                    extra_cards.append(current_number_cards)
-                else:
-                    extra_cards[i] += current_number_cards
-
-            return number_matching * current_number_cards + 1
-
-        extra_cards = deque([])
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            return sum(
-                calculate_extra_cards(line, extra_cards) for line in file
-            )
+        match_counts = self.get_match_counts()
+
+        # Copies won by a card are added to a range of the following cards,
+        # so only the changes in the number of copies are stored
+        changes = [0] * (len(match_counts) + 1)
+        copies = total = 0
+        for i, matches in enumerate(match_counts):
+            copies += changes[i]
+            num_cards = copies + 1
+            total += matches * num_cards + 1
+            if matches:
+                changes[i + 1] += num_cards
+                changes[min(i + 1 + matches, len(match_counts))] -= num_cards
+        return total
 
     def solve(self) -> None:
         """Runs part 1 and part 2."""
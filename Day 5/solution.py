@@ -1,133 +1,279 @@
 """
 Day 5 solution.
 """
+import bisect
+import pathlib
 import sys
-from io import TextIOWrapper
-from typing import Callable, Generator, Iterable, TypeVar
+from typing import Iterable, Iterator
 
-T = TypeVar("T")
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
 
 
-class Solver:
-    """Day 5 solver."""
+def add_piece(starts: list[int], offsets: list[int], start: int, offset: int):
+    """
+    Append a piece to a piecewise map's breakpoints, merging it with the
+    last piece if they have the same offset.
+    """
+    if starts and starts[-1] == start:
+        starts.pop()
+        offsets.pop()
+    if not offsets or offsets[-1] != offset:
+        starts.append(start)
+        offsets.append(offset)
 
-    def __init__(self, filepath: str = "input.txt"):
-        self.filepath = filepath
 
-    def template_solve(
-        self,
-        file: TextIOWrapper,
-        prev_nums: set[T],
-        solve: Callable[[set[T], set[T], int, int, int], None],
-    ) -> None:
+def coalesce(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Sort half-open ranges, merging the ones that overlap or touch and
+    dropping empty ones.
+    """
+    result: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if start >= end:
+            continue
+        if result and start <= result[-1][1]:
+            if end > result[-1][1]:
+                result[-1] = result[-1][0], end
+        else:
+            result.append((start, end))
+    return result
+
+
+class PiecewiseMap:
+    """
+    Map over the non-negative integers that adds offsets[i] to the numbers
+    from starts[i] up to starts[i + 1], with the last piece unbounded.
+    """
+
+    __slots__ = ("starts", "offsets", "image_order")
+
+    def __init__(self, starts: list[int], offsets: list[int]):
+        self.starts = starts
+        self.offsets = offsets
+        # The pieces sorted by where they map to, built on first use
+        self.image_order: list[tuple[int, int, int | None, int]] | None = None
+
+    @classmethod
+    def from_rules(
+        cls, rules: Iterable[tuple[int, int, int]]
+    ) -> "PiecewiseMap":
         """
-        Generic template solver to map from seed values to location values.
+        The map of a list of rules in the form: destination source range.
+        Numbers outside every rule map to themselves.
         """
-        file.readline()  # Blank line separating seed and first map
-        file.readline()  # Map header line
+        starts: list[int] = []
+        offsets: list[int] = []
+        end = 0
+        for destination, source, range_length in sorted(
+            rules, key=lambda rule: rule[1]
+        ):
+            if range_length <= 0:
+                continue
+            if end < source:
+                add_piece(starts, offsets, end, 0)
+            add_piece(starts, offsets, max(source, end), destination - source)
+            end = max(end, source + range_length)
+        add_piece(starts, offsets, end, 0)
+        if starts[0] != 0:
+            starts.insert(0, 0)
+            offsets.insert(0, 0)
+        return cls(starts, offsets)
 
-        line = file.readline()
-        while line:
-            next_nums = set()
-            while line.strip() != "":
-                # Line in the form: destination source range
-                solve(prev_nums, next_nums, *(int(x) for x in line.split()))
-                line = file.readline()
+    def pieces(self) -> Iterator[tuple[int, int | None, int]]:
+        """Yields the start, end and offset of each piece."""
+        yield from zip(self.starts, self.starts[1:] + [None], self.offsets)
 
-            file.readline()  # Blank line separating maps
-            line = file.readline()  # Next map's header line or EOF
-            prev_nums |= next_nums
+    def then(self, other: "PiecewiseMap") -> "PiecewiseMap":
+        """The map applying this map and then the other."""
+        starts: list[int] = []
+        offsets: list[int] = []
+        for start, end, offset in self.pieces():
+            # Split the piece at the other's breakpoints within its image
+            i = bisect.bisect_right(other.starts, start + offset) - 1
+            while True:
+                add_piece(starts, offsets, start, offset + other.offsets[i])
+                i += 1
+                if i == len(other.starts):
+                    break
+                start = other.starts[i] - offset
+                if end is not None and start >= end:
+                    break
+        return PiecewiseMap(starts, offsets)
 
-    def part_1(self):
-        """Part 1 solver."""
+    def lookup(self, num: int) -> int:
+        """Map a number."""
+        return num + self.offsets[bisect.bisect_right(self.starts, num) - 1]
 
-        def solve(
-            prev_nums: set[int],
-            next_nums: set[int],
-            destination: int,
-            source: int,
-            range_length: int,
-        ):
-            for num in list(prev_nums):
-                if not source <= num < source + range_length:
-                    continue
+    def lookup_all(self, nums: list[int]) -> list[int]:
+        """
+        Map every number, sorting them to walk the breakpoints once.
+        """
+        starts, offsets = self.starts, self.offsets
+        result = [0] * len(nums)
+        i = 0
+        for index in sorted(range(len(nums)), key=nums.__getitem__):
+            num = nums[index]
+            while i + 1 < len(starts) and starts[i + 1] <= num:
+                i += 1
+            result[index] = num + offsets[i]
+        return result
 
-                next_nums.add(destination + num - source)
-                prev_nums.remove(num)
+    def map_ranges(
+        self, ranges: Iterable[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """
+        Map half-open ranges to the sorted and coalesced ranges they cover.
+        The ranges are sorted first, so the breakpoints are swept once.
+        """
+        starts, offsets = self.starts, self.offsets
+        result = []
+        i = 0
+        for start, end in coalesce(ranges):
+            while i + 1 < len(starts) and starts[i + 1] <= start:
+                i += 1
+            while True:
+                piece_end = (
+                    min(starts[i + 1], end) if i + 1 < len(starts) else end
+                )
+                result.append((start + offsets[i], piece_end + offsets[i]))
+                if piece_end == end:
+                    break
+                start = piece_end
+                i += 1
+        return coalesce(result)
 
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            # Get seeds
-            prev_nums = set(
-                int(x) for x in file.readline().split(": ")[1].split()
+    def pieces_by_image(self) -> list[tuple[int, int, int | None, int]]:
+        """
+        The start of the image, start, end and offset of each piece, in
+        ascending order of the numbers they map to.
+        """
+        if self.image_order is None:
+            self.image_order = sorted(
+                (start + offset, start, end, offset)
+                for start, end, offset in self.pieces()
             )
+        return self.image_order
 
-            # Solve to find locations
-            self.template_solve(file, prev_nums, solve)
-        return min(prev_nums)
-
-    def part_2(self):
-        """Part 2 solver."""
+    def preimage(self, low: int, high: int) -> list[tuple[int, int]]:
+        """
+        The sorted and coalesced ranges of the numbers that map to the
+        numbers from low up to high.
+        """
+        result = []
+        for image_start, start, end, offset in self.pieces_by_image():
+            if image_start >= high:
+                break
+            first = max(start, low - offset)
+            last = high - offset if end is None else min(end, high - offset)
+            result.append((first, last))
+        return coalesce(result)
 
-        def batch(
-            sequence: Iterable[int], batch_size: int = 1
-        ) -> Generator[tuple[int, ...], None, None]:
-            batch_result = []
-            for x in sequence:
-                batch_result.append(x)
-                if len(batch_result) == batch_size:
-                    yield tuple(batch_result)
-                    batch_result.clear()
-
-        def solve(
-            prev_ranges: set[tuple[int, int]],
-            next_ranges: set[tuple[int, int]],
-            destination: int,
-            source: int,
-            range_length: int,
-        ):
-            stack = list(prev_ranges)
-            while stack:
-                first, last = stack.pop()
-                if last < source or source + range_length - 1 < first:
-                    continue
+    def lowest_image(self, ranges: Iterable[tuple[int, int]]) -> int | None:
+        """
+        The lowest number the half-open ranges map to, if any, walking the
+        pieces from the lowest image up until none can map any lower.
+        """
+        ranges = coalesce(ranges)
+        ends = [end for _, end in ranges]
+        best = None
+        for image_start, start, end, offset in self.pieces_by_image():
+            if best is not None and image_start >= best:
+                break
+            # The first range ending after the piece starts
+            i = bisect.bisect_right(ends, start)
+            if i == len(ranges) or (end is not None and ranges[i][0] >= end):
+                continue
+            location = max(start, ranges[i][0]) + offset
+            if best is None or location < best:
+                best = location
+        return best
 
-                prev_ranges.remove((first, last))
-                next_ranges.add(
-                    (
-                        destination + max(source, first) - source,
-                        destination
-                        + min(source + range_length - 1, last)
-                        - source,
-                    )
-                )
 
-                if first < source:
-                    next_range = first, source - 1
-                    stack.append(next_range)
-                    prev_ranges.add(next_range)
+class Solver:
+    """Day 5 solver."""
 
-                if source + range_length - 1 < last:
-                    next_range = source + range_length, last
-                    stack.append(next_range)
-                    prev_ranges.add(next_range)
+    def __init__(self, filepath: str = "input.txt"):
+        self.filepath = filepath
 
+    @parsed_input
+    def get_almanac(
+        self,
+    ) -> tuple[list[int], list[list[tuple[int, int, int]]]]:
+        """
+        Parse the file for the seeds and the rules of each map,
+        with each rule in the form: destination source range.
+        """
         with open(
             self.filepath, "r", encoding=sys.getdefaultencoding()
         ) as file:
-            # Get seed ranges
-            seed_details = file.readline().split(": ")[1].split()
-            prev_nums = set(
-                (start, start + range_length - 1)
-                for start, range_length in batch(
-                    (int(c) for c in seed_details), 2
+            seeds = [int(x) for x in file.readline().split(": ")[1].split()]
+            maps = []
+            for line in file:
+                if line.strip() == "":
+                    continue
+                if line.strip().endswith("map:"):
+                    maps.append([])
+                    continue
+                destination, source, range_length = (
+                    int(x) for x in line.split()
                 )
-            )
+                maps[-1].append((destination, source, range_length))
+        return seeds, maps
 
-            # Find location ranges
-            self.template_solve(file, prev_nums, solve)
-        return min(x for x, _ in prev_nums)
+    @parsed_input
+    def get_maps(self) -> list[PiecewiseMap]:
+        """The map of each stage from seed to location."""
+        _, maps = self.get_almanac()
+        return [PiecewiseMap.from_rules(rules) for rules in maps]
+
+    @parsed_input
+    def get_location_map(self) -> PiecewiseMap:
+        """Compose the maps into a single map from seed to location."""
+        result = PiecewiseMap([0], [0])
+        for stage in self.get_maps():
+            result = result.then(stage)
+        return result
+
+    def map_seed_ranges(
+        self, ranges: Iterable[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """
+        The location ranges of the half-open seed ranges, mapped through
+        one stage at a time.
+        """
+        for stage in self.get_maps():
+            ranges = stage.map_ranges(ranges)
+        return list(ranges)
+
+    def seed_ranges_for_locations(
+        self, low: int, high: int
+    ) -> list[tuple[int, int]]:
+        """The seed ranges with a location from low up to high."""
+        return self.get_location_map().preimage(low, high)
+
+    def lowest_location(
+        self, seed_ranges: Iterable[tuple[int, int]]
+    ) -> int | None:
+        """
+        The lowest location of the half-open seed ranges, searched from the
+        lowest locations up, or None if there are no seeds.
+        """
+        return self.get_location_map().lowest_image(seed_ranges)
+
+    def part_1(self):
+        """Part 1 solver."""
+        seeds, _ = self.get_almanac()
+        return min(self.get_location_map().lookup_all(seeds))
+
+    def part_2(self):
+        """Part 2 solver."""
+        seeds, _ = self.get_almanac()
+        locations = self.map_seed_ranges(
+            (start, start + range_length)
+            for start, range_length in zip(seeds[::2], seeds[1::2])
+        )
+        return locations[0][0]
 
     def solve(self) -> None:
         """Runs part 1 and part 2."""
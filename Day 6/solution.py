@@ -1,12 +1,25 @@
 """
 Day 6 solution.
 """
+import itertools
+import math
+import pathlib
+import re
 import sys
+from typing import Iterable
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.inputs import lines  # pylint: disable=wrong-import-position
+from aoc2023.inputs import open_input  # pylint: disable=wrong-import-position
+from aoc2023.inputs import tokens  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
 
 
 class Solver:
     """Day 6 solver."""
 
+    NUMBER = re.compile(rb"\d+")
+
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
@@ -18,71 +31,84 @@ class Solver:
 
     def find_minimum_and_maximum_valid_hold_times(
         self, race_time: int, minimum_distance: int
-    ) -> tuple[int, int]:
-        """
-        Finds the maximum and minimum valid hold times.
+    ) -> tuple[int, int] | None:
         """
-        # Find minimum valid hold time
-        left, right = 0, race_time + 1
-        while left < right:
-            time = left + (right - left) // 2
-
-            if self.calculate_distance(race_time, time) > minimum_distance:
-                right = time
-            else:
-                left = time + 1
-        minimum_hold_time = left
-
-        # Find maximum valid hold time
-        right = race_time
-        while left < right:
-            time = right - (right - left) // 2
-
-            if self.calculate_distance(race_time, time) > minimum_distance:
-                left = time
-            else:
-                right = time - 1
-        maximum_hold_time = left
+        Finds the maximum and minimum valid hold times, if any.
 
+        The valid hold times are strictly between the roots of
+        time_held^2 - race_time * time_held + minimum_distance, which are
+        found exactly with the integer square root of the discriminant.
+        """
+        discriminant = race_time * race_time - 4 * minimum_distance
+        if discriminant <= 0:
+            return None
+
+        # Within one of the lower root, so only a step or two from the answer
+        minimum_hold_time = max((race_time - math.isqrt(discriminant)) // 2, 0)
+        while (
+            2 * minimum_hold_time <= race_time
+            and self.calculate_distance(race_time, minimum_hold_time)
+            <= minimum_distance
+        ):
+            minimum_hold_time += 1
+        while (
+            minimum_hold_time > 0
+            and self.calculate_distance(race_time, minimum_hold_time - 1)
+            > minimum_distance
+        ):
+            minimum_hold_time -= 1
+
+        # The distances are symmetric about half the race time
+        maximum_hold_time = race_time - minimum_hold_time
+        if minimum_hold_time > maximum_hold_time:
+            return None
         return minimum_hold_time, maximum_hold_time
 
-    def part_1(self):
-        """Part 1 solver."""
-
-        def parse_line(line: str) -> list[int]:
-            return [int(x) for x in line.split(":")[1].split()]
+    def count_ways(self, race_time: int, minimum_distance: int) -> int:
+        """The number of hold times that beat the distance."""
+        hold_times = self.find_minimum_and_maximum_valid_hold_times(
+            race_time, minimum_distance
+        )
+        if hold_times is None:
+            return 0
+        minimum, maximum = hold_times
+        return maximum - minimum + 1
 
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            race_times = parse_line(file.readline())
-            distances = parse_line(file.readline())
+    def count_ways_batch(
+        self, race_times: Iterable[int], minimum_distances: Iterable[int]
+    ) -> list[int]:
+        """The number of ways to win each of the races."""
+        return list(map(self.count_ways, race_times, minimum_distances))
 
-        result = 1
-        for race_time, distance in zip(race_times, distances):
-            minimum, maximum = self.find_minimum_and_maximum_valid_hold_times(
-                race_time, distance
+    @parsed_input
+    def get_race_tokens(self) -> tuple[list[bytes], list[bytes]]:
+        """
+        Get the race time tokens and the distance tokens.
+        """
+        with open_input(self.filepath) as data:
+            # Only the first two lines are races, blank lines may follow
+            race_times, distances = (
+                tokens(line, self.NUMBER)
+                for line in itertools.islice(lines(data), 2)
             )
-            result *= maximum - minimum + 1
+        return race_times, distances
+
+    def part_1(self):
+        """Part 1 solver."""
+        race_times, distances = (
+            [int(x) for x in tokens] for tokens in self.get_race_tokens()
+        )
 
-        return result
+        return math.prod(self.count_ways_batch(race_times, distances))
 
     def part_2(self):
         """Part 2 solver."""
 
-        def parse_line(line: str) -> int:
-            return int("".join(line.split(":")[1].split()))
-
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            race_time = parse_line(file.readline())
-            distance = parse_line(file.readline())
-
-        minimum, maximum = self.find_minimum_and_maximum_valid_hold_times(
-            race_time, distance
+        race_time, distance = (
+            int(b"".join(tokens)) for tokens in self.get_race_tokens()
         )
-        return maximum - minimum + 1
+
+        return self.count_ways(race_time, distance)
 
     def solve(self) -> None:
         """Runs part 1 and part 2."""
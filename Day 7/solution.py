@@ -5,14 +5,32 @@ from __future__ import annotations
 
 import collections
 import enum
+import operator
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Hand:
     """
     A hand with the cards and the associated bet.
+
+    Hands are ordered by an integer key with the hand type above the
+    strength of each card, four bits per card from the first.
     """
 
+    __slots__ = ("hand", "bet", "type", "key")
+
+    CARD_BITS = 4
+    KEY_BITS = 3 + 5 * CARD_BITS
+    card_strengths = {
+        False: {c: i for i, c in enumerate("23456789TJQKA", start=1)},
+        True: {c: i for i, c in enumerate("J23456789TQKA")},
+    }
+    """The strength of each card, without and with the wildcard."""
+
     class types(enum.Enum):
         """Possible hand types."""
 
@@ -58,25 +76,96 @@ class Hand:
 
         return self.types.HIGH_CARD
 
-    def __init__(self, line: str, include_wildcard: bool = False) -> None:
-        self.hand, bet = line.split()
-        self.bet = int(bet)
+    def __init__(
+        self, hand: str, bet: int, include_wildcard: bool = False
+    ) -> None:
+        self.hand = hand
+        self.bet = bet
         self.type = self._get_hand_type(include_wildcard)
 
-        self.type_to_strength = {
-            c: i for i, c in enumerate(reversed("AKQJT98765432"))
-        }
-        if include_wildcard:
-            self.type_to_strength["J"] = -1
+        strengths = self.card_strengths[include_wildcard]
+        key = self.type.value
+        for c in hand:
+            key = key << self.CARD_BITS | strengths[c]
+        self.key = key
 
     def __lt__(self, other: Hand) -> bool:
-        if self.type != other.type:
-            return self.type.value < other.type.value
+        return self.key < other.key
+
+
+class FenwickTree:
+    """
+    Sparse Fenwick tree of sums over the indices below 2 ** bits, storing
+    only the nodes that have been updated.
+    """
+
+    __slots__ = ("size", "tree")
+
+    def __init__(self, bits: int) -> None:
+        self.size = 1 << bits
+        self.tree: dict[int, int] = {}
+
+    def add(self, index: int, value: int) -> None:
+        """Add the value at the index."""
+        index += 1
+        while index <= self.size:
+            self.tree[index] = self.tree.get(index, 0) + value
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+        """The sum of the values at the indices below the index."""
+        total = 0
+        while index > 0:
+            total += self.tree.get(index, 0)
+            index -= index & -index
+        return total
 
-        for a, b in zip(self.hand, other.hand):
-            if a != b:
-                return self.type_to_strength[a] < other.type_to_strength[b]
-        return False
+
+class RankedHands:
+    """
+    Live set of hands kept in rank order, with the total winnings updated
+    on every insertion and removal.
+
+    Hands are indexed by their key followed by an insertion number, so
+    equal hands are ranked in the order they were inserted, as a stable
+    sort would.
+    """
+
+    SEQUENCE_BITS = 32
+
+    def __init__(self) -> None:
+        bits = Hand.KEY_BITS + self.SEQUENCE_BITS
+        self.counts = FenwickTree(bits)
+        self.bets = FenwickTree(bits)
+        self.live: dict[int, int] = {}
+        self.total_bets = 0
+        self.winnings = 0
+        self.sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.live)
+
+    def update(self, index: int, bet: int, sign: int) -> None:
+        """Add or remove the bet at the index, updating the winnings."""
+        rank = self.counts.prefix_sum(index) + 1
+        bets_above = self.total_bets - self.bets.prefix_sum(index + 1)
+        # Every hand above moves up or down a rank with it
+        self.winnings += sign * (rank * bet + bets_above)
+        self.counts.add(index, sign)
+        self.bets.add(index, sign * bet)
+        self.total_bets += sign * bet
+
+    def insert(self, hand: Hand) -> int:
+        """Add the hand, returning the handle to remove it with."""
+        index = hand.key << self.SEQUENCE_BITS | self.sequence
+        self.sequence += 1
+        self.update(index, hand.bet, 1)
+        self.live[index] = hand.bet
+        return index
+
+    def remove(self, handle: int) -> None:
+        """Remove the hand added with the handle."""
+        self.update(handle, self.live.pop(handle), -1)
 
 
 class Solver:
@@ -85,17 +174,37 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def generic_solve(self, include_wildcard: bool = False) -> int:
-        """Generic solve."""
+    @parsed_input
+    def get_hands(self) -> list[tuple[str, int]]:
+        """Get the cards and bet of every hand."""
         with open(
             self.filepath, "r", encoding=sys.getdefaultencoding()
         ) as file:
-            hands = [Hand(line, include_wildcard) for line in file]
+            return [
+                (hand, int(bet))
+                for hand, bet in (line.split() for line in file)
+            ]
+
+    def generic_solve(self, include_wildcard: bool = False) -> int:
+        """Generic solve."""
+        hands = [
+            Hand(hand, bet, include_wildcard) for hand, bet in self.get_hands()
+        ]
 
         return sum(
-            i * hand.bet for i, hand in enumerate(sorted(hands), start=1)
+            i * hand.bet
+            for i, hand in enumerate(
+                sorted(hands, key=operator.attrgetter("key")), start=1
+            )
         )
 
+    def get_ranking(self, include_wildcard: bool = False) -> RankedHands:
+        """Insert every hand into a live ranking, in order."""
+        ranking = RankedHands()
+        for hand, bet in self.get_hands():
+            ranking.insert(Hand(hand, bet, include_wildcard))
+        return ranking
+
     def part_1(self) -> int:
         """Part 1 solver."""
         return self.generic_solve()
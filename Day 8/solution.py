@@ -1,92 +1,367 @@
 """
 Day 8 solution.
 """
-import itertools
+import array
+import concurrent.futures
+import math
+import os
+import pathlib
 import sys
-from typing import Callable
+from typing import Callable, Iterable
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.inputs import read_bytes  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
+
+class Network:
+    """
+    The network with its nodes interned to integers and the left and right
+    successors of each node in arrays.
+    """
+
+    __slots__ = ("order", "names", "ids", "left", "right")
+
+    def __init__(
+        self,
+        order: str,
+        names: list[str],
+        lefts: Iterable[str],
+        rights: Iterable[str],
+    ):
+        self.order = order
+        self.names = names
+        self.ids = dict(zip(names, range(len(names))))
+        self.left = array.array("i", map(self.ids.__getitem__, lefts))
+        self.right = array.array("i", map(self.ids.__getitem__, rights))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Network":
+        """Parse the order and the nodes."""
+        order, _, nodes = data.partition(b"\n")
+        # Every node is the four tokens: NAME = (LEFT, RIGHT)
+        tokens = nodes.split()
+        names, lefts, rights = (
+            b" ".join(tokens[i::4]).translate(None, b"(,)").decode().split()
+            for i in (0, 2, 3)
+        )
+        return cls(order.strip().decode(), names, lefts, rights)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def end_nodes(self, is_end_node: Callable[[str], bool]) -> bytearray:
+        """Flags of the end nodes."""
+        return bytearray(map(is_end_node, self.names))
+
+
+class JumpTables:
+    """
+    Where each pass of the order from the start nodes ends, to count the
+    steps to an end node a power of two passes at a time.
+
+    Only the nodes a pass can start from are tabled, each by walking a
+    single pass step by step, so end node hits are only checked within
+    one pass from each of them.
+    """
+
+    __slots__ = ("pass_length", "index", "first_hits", "jumps", "any_hits")
+
+    def __init__(
+        self, network: Network, ends: bytearray, starts: Iterable[int]
+    ):
+        self.pass_length = len(network.order)
+        moves = [
+            network.left if direction == "L" else network.right
+            for direction in network.order
+        ]
+
+        # Intern the nodes passes start from as they are reached
+        self.index: dict[int, int] = {}
+        pass_starts: list[int] = []
+
+        def intern(node: int) -> int:
+            if node not in self.index:
+                self.index[node] = len(pass_starts)
+                pass_starts.append(node)
+            return self.index[node]
+
+        for node in starts:
+            intern(node)
+
+        after = array.array("i")
+        self.first_hits = array.array("i")
+        for node in pass_starts:
+            first_hit = 0
+            for step, successors in enumerate(moves, start=1):
+                node = successors[node]
+                if not first_hit and ends[node]:
+                    first_hit = step
+            self.first_hits.append(first_hit)
+            after.append(intern(node))
+
+        # After 2^k passes, and whether any of them hit an end node. Any
+        # pass start repeats within as many passes as there are of them
+        self.jumps = [after]
+        self.any_hits = [bytearray(hit != 0 for hit in self.first_hits)]
+        for _ in range(len(pass_starts).bit_length()):
+            jumps, any_hits = self.jumps[-1], self.any_hits[-1]
+            self.jumps.append(array.array("i", (jumps[i] for i in jumps)))
+            self.any_hits.append(
+                bytearray(
+                    any_hits[i] or any_hits[jumps[i]]
+                    for i in range(len(jumps))
+                )
+            )
+
+    def steps(self, node: int) -> int:
+        """
+        The number of steps from one of the start nodes to the first end
+        node, or -1 if none can be reached.
+        """
+        i = self.index[node]
+        if not self.any_hits[-1][i]:
+            return -1
+
+        passes = 0
+        for k in range(len(self.jumps) - 2, -1, -1):
+            if not self.any_hits[k][i]:
+                i = self.jumps[k][i]
+                passes += 1 << k
+        return passes * self.pass_length + self.first_hits[i]
+
+
+class GhostCycle:
+    """
+    The steps at which a ghost is on an end node: the hits before it enters
+    the cycle of (node, instruction index) states its walk ends up in, and
+    the hits within one lap of that cycle, which repeat every lap.
+    """
+
+    __slots__ = ("tail_hits", "start", "length", "cycle_hits")
+
+    def __init__(
+        self,
+        tail_hits: set[int],
+        start: int,
+        length: int,
+        cycle_hits: set[int],
+    ):
+        self.tail_hits = tail_hits
+        self.start = start
+        self.length = length
+        self.cycle_hits = cycle_hits
+
+    def hits(self, steps: int) -> bool:
+        """Whether the ghost is on an end node after the steps."""
+        if steps < self.start:
+            return steps in self.tail_hits
+        return (
+            self.start + (steps - self.start) % self.length in self.cycle_hits
+        )
+
+
+def find_cycle(network: Network, ends: bytearray, start: int) -> GhostCycle:
+    """
+    Walk from the start node until a (node, instruction index) state
+    repeats.
+    """
+    moves = [
+        network.left if direction == "L" else network.right
+        for direction in network.order
+    ]
+    seen: dict[int, int] = {}
+    hits = []
+    node, steps = start, 0
+    # A state repeats with the same instruction index, so the length of the
+    # cycle is a whole number of passes and only pass starts are compared
+    while node not in seen:
+        seen[node] = steps
+        for successors in moves:
+            if ends[node]:
+                hits.append(steps)
+            node = successors[node]
+            steps += 1
+
+    cycle_start = seen[node]
+    # The start node only counts as a hit once it is returned to
+    return GhostCycle(
+        {hit for hit in hits if 0 < hit < cycle_start},
+        cycle_start,
+        steps - cycle_start,
+        {hit for hit in hits if hit >= cycle_start},
+    )
+
+
+WORKER_NETWORK: tuple[Network, bytearray] | None = None
+"""The network and end nodes of a worker process, set by share_network."""
+
+
+def share_network(network: Network, ends: bytearray) -> None:
+    """
+    Pool initializer keeping the network in the worker, so it is inherited
+    or sent once per worker rather than with every start node.
+    """
+    global WORKER_NETWORK  # pylint: disable=global-statement
+    WORKER_NETWORK = network, ends
+
+
+def find_worker_cycle(start: int) -> GhostCycle:
+    """Find the cycle of the start node in the worker's network."""
+    assert WORKER_NETWORK is not None
+    return find_cycle(*WORKER_NETWORK, start)
+
+
+MERGE_LIMIT = 2**16
+"""Pairs of residues and hits from which ghosts are no longer merged."""
+
+
+def combine_congruences(
+    first: tuple[int, int], second: tuple[int, int]
+) -> tuple[int, int] | None:
+    """
+    The residue and modulus of the numbers congruent to both residues
+    modulo their moduli, if any, by the generalised Chinese remainder
+    theorem.
+    """
+    (a_1, m_1), (a_2, m_2) = first, second
+    gcd = math.gcd(m_1, m_2)
+    if (a_2 - a_1) % gcd:
+        return None
+    modulus = m_1 // gcd * m_2
+    k = (a_2 - a_1) // gcd * pow(m_1 // gcd, -1, m_2 // gcd) % (m_2 // gcd)
+    return (a_1 + m_1 * k) % modulus, modulus
+
+
+def merge_hits(
+    residues: list[int], modulus: int, cycle: GhostCycle
+) -> tuple[list[int], int]:
+    """
+    The sorted residues, and their modulus, of the steps that are one of
+    the residues and one of the cycle's hits.
+    """
+    merged = set()
+    for residue in residues:
+        for hit in cycle.cycle_hits:
+            solution = combine_congruences(
+                (residue, modulus), (hit % cycle.length, cycle.length)
+            )
+            if solution is not None:
+                merged.add(solution[0])
+    return sorted(merged), math.lcm(modulus, cycle.length)
+
+
+def first_common_hit(cycles: list[GhostCycle]) -> int:
+    """
+    The fewest steps, at least one, after which every ghost is on an end
+    node, or -1 if that never happens.
+    """
+    # Before the last ghost enters its cycle, only its tail hits can work
+    last = max(cycles, key=lambda cycle: cycle.start)
+    for steps in sorted(last.tail_hits):
+        if all(cycle.hits(steps) for cycle in cycles):
+            return steps
+
+    # After, every ghost's hits repeat, so solve for the common residues
+    # until there are too many of them to merge
+    cycles = sorted(cycles, key=lambda cycle: len(cycle.cycle_hits))
+    residues, modulus = [0], 1
+    merged = 0
+    for cycle in cycles:
+        if len(residues) * len(cycle.cycle_hits) > MERGE_LIMIT:
+            break
+        residues, modulus = merge_hits(residues, modulus, cycle)
+        merged += 1
+    remaining = cycles[merged:]
+
+    # Then check the steps with the residues lap by lap until every
+    # ghost's hits have repeated
+    lowest = max(last.start, 1)
+    highest = lowest + math.lcm(
+        modulus, *(cycle.length for cycle in remaining)
+    )
+    lap = lowest - lowest % modulus
+    while residues and lap < highest:
+        for residue in residues:
+            steps = lap + residue
+            if lowest <= steps < highest and all(
+                cycle.hits(steps) for cycle in remaining
+            ):
+                return steps
+        lap += modulus
+    return -1
 
 
 class Solver:
     """Day 8 solver."""
 
+    parallel_threshold = 2**20
+    """Nodes times instructions from which ghosts are walked in processes."""
+
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
-    def parse_order_and_graph(self) -> tuple[str, dict[str, tuple[str, ...]]]:
+    @parsed_input
+    def get_network(self) -> Network:
         """
-        Parse the file to get the order and build the graph.
+        Parse the file to get the order and build the network.
         """
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            order = file.readline().strip()
-            file.readline()  # Blank lines
+        return Network.from_bytes(read_bytes(self.filepath))
 
-            graph = {
-                node: tuple(options.strip()[1:-1].split(", "))
-                for node, options in (line.split(" = ") for line in file)
-            }
+    def get_jump_tables(
+        self, is_end_node: Callable[[str], bool], starts: Iterable[int]
+    ) -> JumpTables:
+        """The jump tables from the start nodes to the end nodes."""
+        network = self.get_network()
+        return JumpTables(network, network.end_nodes(is_end_node), starts)
 
-            return order, graph
+    def get_cycles(
+        self, is_end_node: Callable[[str], bool], starts: list[int]
+    ) -> list[GhostCycle]:
+        """
+        The cycle of every start node, each found in a separate process for
+        large networks.
+        """
+        network = self.get_network()
+        ends = network.end_nodes(is_end_node)
+        if (
+            len(starts) < 2
+            or len(network) * len(network.order) < self.parallel_threshold
+        ):
+            return [find_cycle(network, ends, start) for start in starts]
 
-    @staticmethod
-    def get_steps(
-        order: str,
-        node: str,
-        graph: dict[str, tuple[str, ...]],
-        is_end_node: Callable[[str], bool],
-    ) -> int:
-        """Count the number of steps to reach the end node."""
-        steps = 0
-        for direction in itertools.cycle(order):
-            node = graph[node][0 if direction == "L" else 1]
-            steps += 1
-            if is_end_node(node):
-                return steps
-        return -1
-
-    @staticmethod
-    def gcd(a: int, b: int) -> int:
-        """The greatest common divisor."""
-        if a < b:
-            a, b = b, a
-
-        while b != 0:
-            a, b = b, a % b
-        return a
-
-    @staticmethod
-    def lcm(nums: list[int]) -> int:
-        """The lowest common multiple."""
-        while len(nums) > 1:
-            a, b = nums.pop(), nums.pop()
-            nums.append(a * b // Solver.gcd(a, b))
-        return nums[0]
+        with concurrent.futures.ProcessPoolExecutor(
+            min(len(starts), os.cpu_count() or 1),
+            initializer=share_network,
+            initargs=(network, ends),
+        ) as executor:
+            return list(executor.map(find_worker_cycle, starts))
 
     def part_1(self) -> int:
         """Part 1 solver."""
-        order, graph = self.parse_order_and_graph()
+        network = self.get_network()
 
         start_node = "AAA"
-        if start_node not in graph:
+        if start_node not in network.ids:
             return -1
 
-        return self.get_steps(
-            order, start_node, graph, lambda node: node == "ZZZ"
+        start = network.ids[start_node]
+        return self.get_jump_tables(lambda node: node == "ZZZ", [start]).steps(
+            start
         )
 
     def part_2(self) -> int:
         """Part 2 solver."""
-        order, graph = self.parse_order_and_graph()
+        starts = [
+            start
+            for start, node in enumerate(self.get_network().names)
+            if node[-1] == "A"
+        ]
+        if not starts:
+            return -1
 
-        return self.lcm(
-            [
-                self.get_steps(
-                    order, node, graph, lambda node: node[-1] == "Z"
-                )
-                for node in graph
-                if node[-1] == "A"
-            ]
+        return first_common_hit(
+            self.get_cycles(lambda node: node[-1] == "Z", starts)
         )
 
     def solve(self) -> None:
@@ -2,8 +2,15 @@
 Day 9 solution.
 """
 import itertools
+import pathlib
 import sys
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from aoc2023.inputs import ints  # pylint: disable=wrong-import-position
+from aoc2023.inputs import lines  # pylint: disable=wrong-import-position
+from aoc2023.inputs import open_input  # pylint: disable=wrong-import-position
+from aoc2023.parsed import parsed_input  # pylint: disable=wrong-import-position
+
 
 class Solver:
     """Day 9 solver."""
@@ -11,12 +18,17 @@ class Solver:
     def __init__(self, filepath: str = "input.txt"):
         self.filepath = filepath
 
+    @parsed_input
+    def get_sequences(self) -> list[list[int]]:
+        """Parse the sequences."""
+        with open_input(self.filepath) as data:
+            return [ints(line) for line in lines(data)]
+
     @staticmethod
-    def get_num(line: str, find_last: bool) -> int:
+    def get_num(nums: list[int], find_last: bool) -> int:
         """
         Get the next number in the sequence.
         """
-        nums = [int(x) for x in line.split()]
         sequences = []
         while any(x != y for x, y in itertools.pairwise(nums)):
             sequences.append(nums)
@@ -34,10 +46,9 @@ class Solver:
 
     def generic_solve(self, find_last: bool) -> int:
         """Generic solve."""
-        with open(
-            self.filepath, "r", encoding=sys.getdefaultencoding()
-        ) as file:
-            return sum(self.get_num(line, find_last) for line in file)
+        return sum(
+            self.get_num(nums, find_last) for nums in self.get_sequences()
+        )
 
     def part_1(self) -> int:
         """Part 1 solver."""
@@ -0,0 +1,6 @@
+"""
+Shared tooling for running the Day N solvers.
+"""
+from aoc2023.solvers import available_days, get_solver, solver_path
+
+__all__ = ["available_days", "get_solver", "solver_path"]
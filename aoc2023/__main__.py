@@ -0,0 +1,6 @@
+"""
+Entry point for python -m aoc2023.
+"""
+from aoc2023.runner import main
+
+main()
@@ -0,0 +1,227 @@
+"""
+Solve many input files for one or more days at once.
+
+Inputs are read and hashed concurrently with asyncio, then each distinct
+(day, input contents) pair is solved once in a process pool, both parts on
+the same Solver. Records are streamed in the order the inputs were given,
+each as soon as it and every input before it have been solved.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import os
+import pathlib
+import sys
+from typing import Any, AsyncIterator, Iterable
+
+from aoc2023.parsed import file_digest
+from aoc2023.runner import PARTS, format_record, run_day
+from aoc2023.solvers import available_days
+
+DEFAULT_CONCURRENCY = 32
+"""Input files read at the same time."""
+
+
+def expand_inputs(paths: Iterable[str]) -> list[str]:
+    """The files given, with directories replaced by their files in order."""
+    result = []
+    for path in map(pathlib.Path, paths):
+        if path.is_dir():
+            result.extend(
+                str(child)
+                for child in sorted(path.rglob("*"))
+                if child.is_file()
+            )
+        else:
+            result.append(str(path))
+    return result
+
+
+def read_manifest(filepath: str) -> list[tuple[int, str]]:
+    """
+    The (day, input path) jobs in a manifest with one "day path" pair per
+    line. Blank lines and lines starting with # are skipped, and relative
+    paths are relative to the manifest.
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    jobs = []
+    with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                day, path = line.split(maxsplit=1)
+                jobs.append((int(day), os.path.join(directory, path)))
+            except ValueError as error:
+                raise ValueError(
+                    f"{filepath}:{line_number}: expected a day and a path, "
+                    f"got {line!r}."
+                ) from error
+    return jobs
+
+
+async def solve_batch(
+    jobs: list[tuple[int, str]],
+    parts: Iterable[int] = PARTS,
+    workers: int | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Solve every (day, input path) job, yielding their records in order.
+    """
+    parts = list(parts)
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    executor = concurrent.futures.ProcessPoolExecutor(workers)
+    solving: dict[tuple[int, str], asyncio.Future[dict[str, Any]]] = {}
+
+    async def solve_job(day: int, filepath: str) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                digest = await asyncio.to_thread(file_digest, filepath)
+            except OSError as error:
+                return {
+                    "day": day,
+                    "input": filepath,
+                    "parts": [],
+                    "error": repr(error),
+                    "wall": 0.0,
+                    "cpu": 0.0,
+                }
+
+        # Inputs with the same contents are only solved once
+        key = day, digest
+        if key not in solving:
+            solving[key] = loop.run_in_executor(
+                executor, run_day, day, parts, filepath
+            )
+        record = dict(await asyncio.shield(solving[key]))
+        if record["input"] != filepath:
+            record["duplicate_of"] = record["input"]
+            record["input"] = filepath
+        return record
+
+    with executor:
+        tasks = [
+            asyncio.create_task(solve_job(day, filepath))
+            for day, filepath in jobs
+        ]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+async def run(args: argparse.Namespace, jobs: list[tuple[int, str]]) -> None:
+    """Stream the records of the jobs to stdout and the output file."""
+    with contextlib.ExitStack() as stack:
+        output = (
+            stack.enter_context(
+                open(args.output, "w", encoding=sys.getdefaultencoding())
+            )
+            if args.output is not None
+            else None
+        )
+        async for record in solve_batch(
+            jobs, args.parts, args.workers, args.concurrency
+        ):
+            line = json.dumps(record, default=str)
+            print(line if args.jsonl else format_record(record), flush=True)
+            if output is not None:
+                output.write(line + "\n")
+                output.flush()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc2023.batch",
+        description="Solve many input files in a process pool.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Input files or directories of input files.",
+    )
+    parser.add_argument(
+        "-d",
+        "--days",
+        nargs="+",
+        type=int,
+        default=[],
+        help="Days to solve every input with.",
+    )
+    parser.add_argument(
+        "-m",
+        "--manifest",
+        default=None,
+        help='File with a "day path" pair on each line to solve.',
+    )
+    parser.add_argument(
+        "-p",
+        "--parts",
+        nargs="+",
+        type=int,
+        choices=PARTS,
+        default=list(PARTS),
+        help="Parts to run, defaults to both.",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes, defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Input files read at once, defaults to {DEFAULT_CONCURRENCY}.",
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Print each record as a line of JSON.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Write the records as lines of JSON to this path.",
+    )
+    args = parser.parse_args(argv)
+    if args.inputs and not args.days:
+        parser.error("--days is required with input paths.")
+    if not args.inputs and args.manifest is None:
+        parser.error("Expected input paths or a --manifest.")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    jobs = [
+        (day, filepath)
+        for filepath in expand_inputs(args.inputs)
+        for day in args.days
+    ]
+    if args.manifest is not None:
+        jobs.extend(read_manifest(args.manifest))
+
+    missing = {day for day, _ in jobs} - set(available_days())
+    if missing:
+        print(f"No solver for days: {sorted(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    asyncio.run(run(args, jobs))
+
+
+if __name__ == "__main__":
+    main()
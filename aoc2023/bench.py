@@ -0,0 +1,211 @@
+"""
+Benchmark suite timing each day's solver across generated input sizes.
+
+For every day, inputs are generated at increasing scales and each part is
+timed on a fresh Solver, so parsing is included. The empirical complexity is
+estimated by fitting time = c * size^k on a log-log scale, where size is the
+input length in bytes.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Iterable
+
+from aoc2023.generators import GENERATORS, generate
+from aoc2023.runner import PARTS
+from aoc2023.solvers import get_solver
+
+DEFAULT_SCALES: dict[int, tuple[int, ...]] = {
+    1: (2000, 4000, 8000, 16000),
+    2: (1000, 2000, 4000, 8000),
+    3: (50, 100, 200, 400),
+    4: (1000, 2000, 4000, 8000),
+    5: (10, 20, 40, 80),
+    6: (2, 4, 8, 16),
+    7: (1000, 2000, 4000, 8000),
+    8: (2, 4, 8, 16),
+    9: (500, 1000, 2000, 4000),
+    10: (40, 80, 160, 320),
+    11: (50, 100, 150, 200),
+    12: (100, 200, 400, 800),
+    13: (20, 40, 80, 160),
+    14: (20, 40, 60, 80),
+    15: (1000, 2000, 4000, 8000),
+    16: (20, 40, 60, 80),
+    17: (25, 50, 100, 150),
+    18: (20, 40, 80, 160),
+    19: (20, 40, 80, 160),
+    20: (6, 8, 10, 12),
+    21: (21, 41, 81, 161),
+    22: (250, 500, 1000, 2000),
+    23: (3, 4, 5, 6),
+    24: (20, 40, 80, 160),
+    25: (50, 100, 200, 400),
+}
+QUADRATIC_EXPONENT = 1.8
+"""Fitted exponents at or above this are flagged as quadratic or worse."""
+
+
+def time_part(day: int, part: int, filepath: str, repeats: int) -> float:
+    """The best wall time of solving the part on a fresh Solver."""
+    solver_class = get_solver(day)
+    best = math.inf
+    for _ in range(repeats):
+        solver = solver_class(filepath)
+        start = time.perf_counter()
+        getattr(solver, f"part_{part}")()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float | None:
+    """
+    Least squares fit of the exponent k in time = c * size^k.
+    """
+    points = [
+        (math.log(size), math.log(elapsed))
+        for size, elapsed in zip(sizes, times)
+        if size > 0 and elapsed > 0
+    ]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return (
+        sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+    )
+
+
+def benchmark_day(
+    day: int,
+    scales: Iterable[int],
+    parts: Iterable[int] = PARTS,
+    repeats: int = 1,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Time the parts of a day's solver across the scales."""
+    parts = list(parts)
+    record: dict[str, Any] = {
+        "day": day,
+        "scales": [],
+        "sizes": [],
+        "parts": {part: [] for part in parts},
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in scales:
+            filepath = os.path.join(directory, f"{day}_{scale}.txt")
+            contents = generate(day, scale, seed)
+            with open(
+                filepath, "w", encoding=sys.getdefaultencoding()
+            ) as file:
+                file.write(contents)
+
+            record["scales"].append(scale)
+            record["sizes"].append(len(contents))
+            for part in parts:
+                record["parts"][part].append(
+                    time_part(day, part, filepath, repeats)
+                )
+
+    record["exponents"] = {
+        part: fit_exponent(record["sizes"], times)
+        for part, times in record["parts"].items()
+    }
+    return record
+
+
+def format_record(record: dict[str, Any]) -> str:
+    """Human readable summary of a day's benchmark."""
+    lines = [f"Day {record['day']}"]
+    sizes = ", ".join(f"{size:>10}" for size in record["sizes"])
+    lines.append(f"  Size (bytes): {sizes}")
+    for part, times in record["parts"].items():
+        exponent = record["exponents"][part]
+        fit = "n/a" if exponent is None else f"O(n^{exponent:.2f})"
+        if exponent is not None and exponent >= QUADRATIC_EXPONENT:
+            fit += " quadratic or worse"
+        timings = ", ".join(f"{elapsed:>9.4f}s" for elapsed in times)
+        lines.append(f"  Part {part}:       {timings}  {fit}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc2023.bench",
+        description=(
+            "Time each day's solver across generated input sizes and fit "
+            "the empirical complexity."
+        ),
+    )
+    parser.add_argument(
+        "-d",
+        "--days",
+        nargs="+",
+        type=int,
+        default=None,
+        help="Days to benchmark, defaults to every day.",
+    )
+    parser.add_argument(
+        "-p",
+        "--parts",
+        nargs="+",
+        type=int,
+        choices=PARTS,
+        default=list(PARTS),
+    )
+    parser.add_argument(
+        "-s",
+        "--scales",
+        nargs="+",
+        type=int,
+        default=None,
+        help="Scales to generate, defaults to a preset for each day.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeats",
+        type=int,
+        default=1,
+        help="Runs per measurement, the best time is kept.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Write the timings as JSON to this path.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    records = []
+    for day in args.days or sorted(GENERATORS):
+        record = benchmark_day(
+            day,
+            args.scales or DEFAULT_SCALES[day],
+            args.parts,
+            args.repeats,
+            args.seed,
+        )
+        print(format_record(record), flush=True)
+        records.append(record)
+
+    if args.output is not None:
+        with open(args.output, "w", encoding=sys.getdefaultencoding()) as file:
+            json.dump(records, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+Cross-check the Python and C++ solvers on the same generated inputs.
+
+The C++ solvers are built with the Makefile, then both implementations are
+run as separate processes on each input. Their answers are compared and the
+ratio of their wall times, less the start-up time of each, is reported per
+day and per size.
+
+The C++ solvers read a final newline as an extra empty line, so the inputs
+are written without it. Scales are kept to those the C++ integer types can
+represent, and divergences in the C++ solvers that are already known are
+reported as expected rather than as mismatches.
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Iterable
+
+from aoc2023.bench import DEFAULT_SCALES
+from aoc2023.generators import GENERATORS, generate
+from aoc2023.solvers import ROOT, solver_path
+
+CPP_MAX_SCALES = {6: 4, 7: 2000}
+"""
+Scales above which the C++ answers overflow: the concatenated Day 6 race
+and the Day 7 winnings.
+"""
+CROSSCHECK_SCALES = {
+    **DEFAULT_SCALES,
+    6: (1, 2, 3, 4),
+    7: (250, 500, 1000, 2000),
+}
+"""The default scales of each day, within the C++ solvers' limits."""
+KNOWN_DIVERGENCES = {
+    3: (
+        "the C++ solver places numbers ending a line one column to the "
+        "left and counts every symbol as a gear"
+    ),
+}
+"""Days whose C++ solver is known to give different answers."""
+MIN_COMPUTE_TIME = 0.01
+"""Seconds of compute below which no speed ratio is reported."""
+STARTUP_ARGS = ("-", "-", "-")
+"""Arguments both solvers reject before reading any input."""
+
+
+def build(day: int) -> str:
+    """Build the day's C++ solver with make, returning the binary's path."""
+    target = f"build/{day}"
+    subprocess.run(
+        ["make", "--no-print-directory", target],
+        cwd=ROOT,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return str(ROOT / target)
+
+
+def parse_output(output: str) -> list[str]:
+    """Get the answers from the output of a solver's solve()."""
+    lines = [line.strip() for line in output.splitlines()]
+    return [
+        lines[i + 1]
+        for i, line in enumerate(lines[:-1])
+        if line in ("Part 1:", "Part 2:")
+    ]
+
+
+def run(
+    command: list[str], timeout: float | None, repeats: int = 1
+) -> dict[str, Any]:
+    """
+    Run a solver, recording its answers and best wall time. The repeats stop
+    at the first failed run.
+    """
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        try:
+            process = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+            )
+        except subprocess.TimeoutExpired:
+            return {"error": "timeout", "wall": time.perf_counter() - start}
+
+        wall = time.perf_counter() - start
+        if process.returncode != 0:
+            stderr = process.stderr.strip().splitlines()
+            error = stderr[-1] if stderr else f"exit code {process.returncode}"
+            return {"error": error, "wall": wall}
+        best = min(best, wall)
+    return {"answers": parse_output(process.stdout), "wall": best}
+
+
+def startup_time(command: list[str], repeats: int = 1) -> float:
+    """
+    The best wall time of starting a solver that exits on invalid arguments,
+    including the imports of the Python solvers.
+    """
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(
+            command + list(STARTUP_ARGS), capture_output=True, check=False
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def known_divergence(day: int, scale: int) -> str | None:
+    """Why the day's C++ answers are expected to differ, if they are."""
+    if scale > CPP_MAX_SCALES.get(day, scale):
+        return "the C++ integer types overflow at this scale"
+    return KNOWN_DIVERGENCES.get(day)
+
+
+def compute_time(result: dict[str, Any]) -> float:
+    """The wall time of a solver run less its start-up time."""
+    return max(result["wall"] - result["startup"], 0.0)
+
+
+def compute_ratio(python: dict[str, Any], cpp: dict[str, Any]) -> float | None:
+    """
+    The ratio of the Python to C++ compute times, if both are long enough
+    to tell apart from the noise in the start-up times.
+    """
+    python_compute, cpp_compute = compute_time(python), compute_time(cpp)
+    if min(python_compute, cpp_compute) < MIN_COMPUTE_TIME:
+        return None
+    return python_compute / cpp_compute
+
+
+def crosscheck_day(
+    day: int,
+    scales: Iterable[int],
+    seed: int = 0,
+    timeout: float | None = None,
+    repeats: int = 1,
+) -> dict[str, Any]:
+    """Compare the day's Python and C++ solvers across the scales."""
+    python_command = [sys.executable, str(solver_path(day))]
+    cpp_command = [build(day)]
+    python_startup = startup_time(python_command, repeats)
+    cpp_startup = startup_time(cpp_command, repeats)
+    record: dict[str, Any] = {"day": day, "runs": []}
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in scales:
+            filepath = os.path.join(directory, f"{day}_{scale}.txt")
+            contents = generate(day, scale, seed).rstrip("\n")
+            with open(
+                filepath, "w", encoding=sys.getdefaultencoding()
+            ) as file:
+                file.write(contents)
+
+            python = run(python_command + [filepath], timeout, repeats)
+            python["startup"] = python_startup
+            cpp = run(cpp_command + [filepath], timeout, repeats)
+            cpp["startup"] = cpp_startup
+            both_ran = "answers" in python and "answers" in cpp
+            match = both_ran and python["answers"] == cpp["answers"]
+            record["runs"].append(
+                {
+                    "scale": scale,
+                    "size": len(contents),
+                    "python": python,
+                    "cpp": cpp,
+                    "match": match,
+                    "expected": (
+                        known_divergence(day, scale)
+                        if both_ran and not match
+                        else None
+                    ),
+                    "ratio": compute_ratio(python, cpp) if both_ran else None,
+                }
+            )
+    return record
+
+
+def format_record(record: dict[str, Any]) -> str:
+    """Human readable summary of a day's cross-check."""
+    lines = [f"Day {record['day']}"]
+    for run_record in record["runs"]:
+        python, cpp = run_record["python"], run_record["cpp"]
+        if "answers" not in python or "answers" not in cpp:
+            status = "ERROR"
+            details = (
+                f"python: {python.get('error', 'ok')}, "
+                f"c++: {cpp.get('error', 'ok')}"
+            )
+        else:
+            if run_record["match"]:
+                status = "OK"
+            elif run_record["expected"] is not None:
+                status = "EXPECTED"
+            else:
+                status = "MISMATCH"
+            ratio = (
+                f"{run_record['ratio']:.1f}x"
+                if run_record["ratio"] is not None
+                else "n/a"
+            )
+            details = (
+                f"python {compute_time(python):.3f}s, "
+                f"c++ {compute_time(cpp):.3f}s after start-up, "
+                f"ratio {ratio}"
+            )
+            if run_record["expected"] is not None:
+                details += f", {run_record['expected']}"
+            elif not run_record["match"]:
+                details += (
+                    f", python answers {python['answers']}"
+                    f", c++ answers {cpp['answers']}"
+                )
+        lines.append(
+            f"  Scale {run_record['scale']:>6} "
+            f"({run_record['size']} bytes): {status:<8} {details}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc2023.crosscheck",
+        description=(
+            "Check the Python and C++ solvers agree on generated inputs and "
+            "compare their speed."
+        ),
+    )
+    parser.add_argument(
+        "-d",
+        "--days",
+        nargs="+",
+        type=int,
+        default=None,
+        help="Days to check, defaults to every day.",
+    )
+    parser.add_argument(
+        "-s",
+        "--scales",
+        nargs="+",
+        type=int,
+        default=None,
+        help=(
+            "Scales to generate, defaults to the benchmark presets within "
+            "the C++ solvers' limits."
+        ),
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=None,
+        help="Seconds before a single solver run is abandoned.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeats",
+        type=int,
+        default=3,
+        help="Runs of each solver per input, the best time is kept.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Write the results as JSON to this path.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    records = []
+    for day in args.days or sorted(GENERATORS):
+        record = crosscheck_day(
+            day,
+            args.scales or CROSSCHECK_SCALES[day],
+            args.seed,
+            args.timeout,
+            args.repeats,
+        )
+        print(format_record(record), flush=True)
+        records.append(record)
+
+    if args.output is not None:
+        with open(args.output, "w", encoding=sys.getdefaultencoding()) as file:
+            json.dump(records, file, indent=2)
+
+    if not all(
+        run["match"] or run["expected"] is not None
+        for record in records
+        for run in record["runs"]
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Long-running daemon keeping every Day N solver imported and ready.
+
+Requests and responses are JSON objects, one per line, over a Unix domain
+socket. A request has the day, the part and either the path of the input or
+the input itself:
+
+    {"day": 1, "part": 2, "path": "Day 1/input.txt"}
+    {"day": 1, "part": 2, "input": "two1nine\\n..."}
+
+and the response has the answer, the wall time spent solving and whether
+the answer was cached, or the error raised:
+
+    {"answer": 281, "wall": 0.0012, "cached": false}
+
+Solves run in a pool of worker processes that import every solver when they
+start, so each request only pays for parsing and solving.
+"""
+import argparse
+import concurrent.futures
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+from typing import Any
+
+from aoc2023 import results
+from aoc2023.parsed import file_digest
+from aoc2023.runner import PARTS
+from aoc2023.solvers import available_days, get_solver, load_module
+
+DEFAULT_SOCKET = os.path.join(
+    tempfile.gettempdir(), f"aoc2023-{os.getuid()}.sock"
+)
+
+
+def preload() -> None:
+    """Import every solver, run in each worker process when it starts."""
+    # The daemon handles interrupts and shuts the workers down itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for day in available_days():
+        load_module(day)
+
+
+def solve(
+    day: int, part: int, filepath: str | None, contents: str | None
+) -> dict[str, Any]:
+    """Solve the part of the day on the input file or the input itself."""
+    start = time.perf_counter()
+    try:
+        if contents is not None:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                suffix=".txt",
+                encoding=sys.getdefaultencoding(),
+                delete=False,
+            ) as file:
+                file.write(contents)
+            try:
+                solver = get_solver(day)(file.name)
+                answer = getattr(solver, f"part_{part}")()
+            finally:
+                os.remove(file.name)
+        else:
+            solver = get_solver(day)(filepath)
+            answer = getattr(solver, f"part_{part}")()
+    except Exception as error:  # pylint: disable=broad-except
+        return {"error": repr(error), "wall": time.perf_counter() - start}
+    return {"answer": answer, "wall": time.perf_counter() - start}
+
+
+def validate(message: Any) -> str | None:
+    """The reason the request is invalid, if it is."""
+    if not isinstance(message, dict):
+        return "Expected a JSON object."
+    # Booleans are ints, and true would otherwise be day or part 1
+    day, part = message.get("day"), message.get("part")
+    if isinstance(day, bool) or day not in available_days():
+        return f"No solver for day {day!r}."
+    if isinstance(part, bool) or part not in PARTS:
+        return f"Expected part to be one of {PARTS}."
+    if ("path" in message) == ("input" in message):
+        return 'Expected exactly one of "path" or "input".'
+    for key in ("path", "input"):
+        # An int path would be opened as one of the daemon's descriptors
+        if key in message and not isinstance(message[key], str):
+            return f'Expected "{key}" to be a string.'
+    return None
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server handing each solve to a process pool."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        workers: int | None = None,
+        cache: results.ResultCache | None = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache or results.ResultCache()
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            self.workers, initializer=preload
+        )
+        super().__init__(socket_path, RequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Answers every request line on a connection in order."""
+
+    server: Server
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError as error:
+                response = {"error": f"Invalid JSON: {error}"}
+            else:
+                reason = validate(message)
+                response = (
+                    {"error": reason}
+                    if reason is not None
+                    else self.solve(message)
+                )
+
+            self.wfile.write(json.dumps(response, default=str).encode())
+            self.wfile.write(b"\n")
+            self.wfile.flush()
+
+    def solve(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Answer a valid request from the cache or the process pool."""
+        day, part = message["day"], message["part"]
+        try:
+            input_digest = (
+                results.content_digest(message["input"])
+                if "input" in message
+                else file_digest(message["path"])
+            )
+        except (OSError, TypeError, ValueError) as error:
+            return {"error": repr(error)}
+
+        key = results.result_key(day, part, input_digest)
+        found, answer = self.server.cache.get(key)
+        if found:
+            return {"answer": answer, "wall": 0.0, "cached": True}
+
+        response = self.server.executor.submit(
+            solve, day, part, message.get("path"), message.get("input")
+        ).result()
+        if "answer" in response:
+            self.server.cache.put(key, response["answer"])
+        return {**response, "cached": False}
+
+
+def interrupt(*_: Any) -> None:
+    """Signal handler stopping the daemon like a keyboard interrupt."""
+    raise KeyboardInterrupt
+
+
+def serve(
+    socket_path: str = DEFAULT_SOCKET,
+    workers: int | None = None,
+    cache: results.ResultCache | None = None,
+) -> None:
+    """Serve requests on the socket until interrupted or terminated."""
+    if os.path.exists(socket_path):
+        try:
+            with socket.socket(socket.AF_UNIX) as client:
+                client.connect(socket_path)
+        except ConnectionRefusedError:
+            # Left behind by a daemon that did not shut down cleanly
+            os.remove(socket_path)
+        else:
+            raise RuntimeError(f"A daemon is already serving {socket_path}.")
+
+    with Server(socket_path, workers, cache) as server:
+        # Start the workers now rather than on the first request
+        concurrent.futures.wait(
+            [
+                server.executor.submit(preload)
+                for _ in range(server.workers)
+            ]
+        )
+        print(f"Serving on {socket_path}", flush=True)
+        signal.signal(signal.SIGTERM, interrupt)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def request(
+    day: int,
+    part: int,
+    filepath: str | None = None,
+    contents: str | None = None,
+    socket_path: str = DEFAULT_SOCKET,
+) -> dict[str, Any]:
+    """Send a solve request to the daemon and wait for its response."""
+    message: dict[str, Any] = {"day": day, "part": part}
+    if contents is not None:
+        message["input"] = contents
+    else:
+        message["path"] = os.path.abspath(filepath or "input.txt")
+
+    with socket.socket(socket.AF_UNIX) as client:
+        client.connect(socket_path)
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps(message).encode() + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc2023.daemon",
+        description="Serve or send solve requests over a Unix socket.",
+    )
+    parser.add_argument(
+        "-s",
+        "--socket",
+        default=DEFAULT_SOCKET,
+        help=f'Socket path, defaults to "{DEFAULT_SOCKET}".',
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Run the daemon.")
+    serve_parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes, defaults to the number of CPUs.",
+    )
+    serve_parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get(results.CACHE_DIR_ENV),
+        help=(
+            "Directory to persist answers to, defaults to the "
+            f"{results.CACHE_DIR_ENV} environment variable."
+        ),
+    )
+    serve_parser.add_argument(
+        "--cache-entries",
+        type=int,
+        default=results.DEFAULT_MAX_ENTRIES,
+        help="Answers kept in memory, 0 disables the in-memory cache.",
+    )
+    serve_parser.add_argument(
+        "--cache-bytes",
+        type=int,
+        default=results.DEFAULT_MAX_BYTES,
+        help="Size limit of the persisted answers.",
+    )
+
+    solve_parser = commands.add_parser(
+        "solve", help="Solve an input with a running daemon."
+    )
+    solve_parser.add_argument("day", type=int)
+    solve_parser.add_argument("part", type=int, choices=PARTS)
+    solve_parser.add_argument(
+        "path", help='Input path, or "-" to send the input from stdin.'
+    )
+    solve_parser.add_argument(
+        "--send-contents",
+        action="store_true",
+        help="Send the contents of the input rather than its path.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    if args.command == "serve":
+        cache = results.ResultCache(
+            args.cache_dir, args.cache_entries, args.cache_bytes
+        )
+        serve(args.socket, args.workers, cache)
+        return
+
+    filepath = contents = None
+    if args.path == "-":
+        contents = sys.stdin.read()
+    elif args.send_contents:
+        with open(args.path, "r", encoding=sys.getdefaultencoding()) as file:
+            contents = file.read()
+    else:
+        filepath = args.path
+
+    response = request(args.day, args.part, filepath, contents, args.socket)
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        sys.exit(1)
+    print(response["answer"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,904 @@
+"""
+Synthetic input generators for every day.
+
+Each generator takes a scale and a random number generator and returns the
+contents of a valid input file. The meaning of the scale depends on the day,
+see SCALES for a description of each.
+"""
+import argparse
+import itertools
+import random
+import string
+import sys
+from typing import Callable
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: dict[int, Generator] = {}
+SCALES: dict[int, str] = {}
+
+
+def generator(day: int, scale: str) -> Callable[[Generator], Generator]:
+    """Register a generator for the day with a description of its scale."""
+
+    def register(function: Generator) -> Generator:
+        GENERATORS[day] = function
+        SCALES[day] = scale
+        return function
+
+    return register
+
+
+def generate(day: int, scale: int, seed: int | None = None) -> str:
+    """Generate an input for the day at the given scale."""
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}.")
+    return GENERATORS[day](scale, random.Random(seed))
+
+
+def unique_names(
+    rng: random.Random,
+    count: int,
+    length: int,
+    alphabet: str = string.ascii_lowercase,
+    exclude: set[str] | None = None,
+) -> list[str]:
+    """Generate distinct random names, growing longer if needed."""
+    exclude = exclude or set()
+    names: set[str] = set()
+    while len(names) < count:
+        if len(names) + len(exclude) >= len(alphabet) ** length // 2:
+            length += 1
+        name = "".join(rng.choices(alphabet, k=length))
+        if name not in exclude:
+            names.add(name)
+    result = sorted(names)
+    rng.shuffle(result)
+    return result
+
+
+def hamiltonian_loop(
+    rng: random.Random, rows: int, cols: int, coverage: float = 0.6
+) -> list[tuple[int, int]]:
+    """
+    Generate a simple closed loop of cells on a (2 * rows) x (2 * cols) grid.
+
+    A random tree is grown over a subset of a rows x cols coarse grid, then the
+    loop walks around the tree so it visits every cell of the tree's 2x2
+    blocks. The cells are returned in loop order.
+    """
+    target = max(1, int(rows * cols * coverage))
+    start = rng.randrange(rows), rng.randrange(cols)
+    in_tree = {start}
+    edges: set[tuple[tuple[int, int], tuple[int, int]]] = set()
+    frontier = [start]
+    while frontier and len(in_tree) < target:
+        a, b = node = frontier[rng.randrange(len(frontier))]
+        options = [
+            (a + d_a, b + d_b)
+            for d_a, d_b in itertools.pairwise((0, -1, 0, 1, 0))
+            if 0 <= a + d_a < rows
+            and 0 <= b + d_b < cols
+            and (a + d_a, b + d_b) not in in_tree
+        ]
+        if not options:
+            frontier.remove(node)
+            continue
+        next_node = rng.choice(options)
+        in_tree.add(next_node)
+        edges.add((min(node, next_node), max(node, next_node)))
+        frontier.append(next_node)
+
+    # Every block starts as its own 4 cell cycle, tree edges merge the cycles
+    links: dict[tuple[int, int], set[tuple[int, int]]] = {}
+    for a, b in in_tree:
+        y, x = 2 * a, 2 * b
+        cells = [(y, x), (y, x + 1), (y + 1, x + 1), (y + 1, x)]
+        for cell, next_cell in zip(cells, cells[1:] + cells[:1]):
+            links.setdefault(cell, set()).add(next_cell)
+            links.setdefault(next_cell, set()).add(cell)
+
+    def swap(
+        first: tuple[tuple[int, int], tuple[int, int]],
+        second: tuple[tuple[int, int], tuple[int, int]],
+    ) -> None:
+        for u, v in (first, second):
+            links[u].discard(v)
+            links[v].discard(u)
+        (u_0, v_0), (u_1, v_1) = first, second
+        for u, v in ((u_0, u_1), (v_0, v_1)):
+            links[u].add(v)
+            links[v].add(u)
+
+    for (a_0, b_0), (a_1, b_1) in edges:
+        y, x = 2 * a_0, 2 * b_0
+        if a_0 == a_1:  # Horizontal edge
+            swap(((y, x + 1), (y + 1, x + 1)), ((y, x + 2), (y + 1, x + 2)))
+        else:  # Vertical edge
+            swap(((y + 1, x), (y + 1, x + 1)), ((y + 2, x), (y + 2, x + 1)))
+
+    first = next(iter(links))
+    loop = [first]
+    prev, node = first, min(links[first])
+    while node != first:
+        loop.append(node)
+        prev, node = node, next(n for n in links[node] if n != prev)
+    return loop
+
+
+def scale_loop(
+    loop: list[tuple[int, int]], factor: int
+) -> list[tuple[int, int]]:
+    """Scale a loop of cells, filling in the cells between each step."""
+    result = []
+    for (y_0, x_0), (y_1, x_1) in zip(loop, loop[1:] + loop[:1]):
+        for k in range(factor):
+            result.append(
+                (
+                    y_0 * factor + (y_1 - y_0) * k,
+                    x_0 * factor + (x_1 - x_0) * k,
+                )
+            )
+    return result
+
+
+def loop_corners(loop: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Reduce a loop of cells to the cells where the loop turns."""
+    n = len(loop)
+
+    def step(k: int) -> tuple[int, int]:
+        (y_0, x_0), (y_1, x_1) = loop[k - 1], loop[k % n]
+        return y_1 - y_0, x_1 - x_0
+
+    return [loop[k] for k in range(n) if step(k) != step(k + 1)]
+
+
+@generator(1, "number of lines")
+def day_1(scale: int, rng: random.Random) -> str:
+    """Calibration lines mixing digits, digit words and other letters."""
+    words = [
+        "one",
+        "two",
+        "three",
+        "four",
+        "five",
+        "six",
+        "seven",
+        "eight",
+        "nine",
+    ]
+    lines = []
+    for _ in range(scale):
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            letters = rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))
+            tokens.append(
+                rng.choice(
+                    [
+                        rng.choice(words),
+                        str(rng.randint(1, 9)),
+                        "".join(letters),
+                    ]
+                )
+            )
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+    return "\n".join(lines) + "\n"
+
+
+@generator(2, "number of games")
+def day_2(scale: int, rng: random.Random) -> str:
+    """Games with random draws of each colour."""
+    colours = ["red", "green", "blue"]
+    lines = []
+    for game in range(1, scale + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            drawn = rng.sample(colours, rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in drawn))
+        lines.append(f"Game {game}: {'; '.join(draws)}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(3, "width and height of the schematic")
+def day_3(scale: int, rng: random.Random) -> str:
+    """A schematic with numbers and randomly placed symbols."""
+    size = max(scale, 3)
+    grid = [["."] * size for _ in range(size)]
+    for i in range(size):
+        j = rng.randint(0, 3)
+        while j < size:
+            length = rng.randint(1, 3)
+            if j + length > size:
+                break
+            for k in range(length):
+                grid[i][j + k] = str(rng.randint(1 if k == 0 else 0, 9))
+            j += length + rng.randint(1, 6)
+    for _ in range(size * size // 12):
+        i, j = rng.randrange(size), rng.randrange(size)
+        if grid[i][j] == ".":
+            grid[i][j] = rng.choice("*#+$/@=%&-*")
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(4, "number of cards")
+def day_4(scale: int, rng: random.Random) -> str:
+    """Scratchcards with bounded runs of matching numbers."""
+    block = 10
+    lines = []
+    for card in range(1, scale + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning, received = numbers[:10], numbers[10:]
+        # Keep the copies bounded so answers fit in 64 bit integers
+        matches = rng.randint(0, min(5, block - 1 - (card - 1) % block))
+        received[:matches] = winning[:matches]
+        rng.shuffle(received)
+        lines.append(
+            f"Card {card:>4}: "
+            + " ".join(f"{x:>2}" for x in winning)
+            + " | "
+            + " ".join(f"{x:>2}" for x in received)
+        )
+    return "\n".join(lines) + "\n"
+
+
+@generator(5, "number of rules per map")
+def day_5(scale: int, rng: random.Random) -> str:
+    """An almanac where every map permutes a partition of the range."""
+    names = [
+        "seed",
+        "soil",
+        "fertilizer",
+        "water",
+        "light",
+        "temperature",
+        "humidity",
+        "location",
+    ]
+    limit = 1 << 32
+    seeds = []
+    for _ in range(10):
+        seeds += [rng.randrange(limit // 2), rng.randrange(1, limit // 20)]
+    sections = ["seeds: " + " ".join(map(str, seeds))]
+    for source, destination in itertools.pairwise(names):
+        # Each map permutes a partition of the whole range, like the puzzle's
+        cuts = [0] + sorted(rng.sample(range(1, limit), max(scale, 1) - 1))
+        pieces = list(itertools.pairwise(cuts + [limit]))
+        shuffled = list(pieces)
+        rng.shuffle(shuffled)
+        lines = []
+        position = 0
+        for start, end in shuffled:
+            lines.append(f"{position} {start} {end - start}")
+            position += end - start
+        rng.shuffle(lines)
+        sections.append(f"{source}-to-{destination} map:\n" + "\n".join(lines))
+    return "\n\n".join(sections) + "\n"
+
+
+@generator(6, "number of races")
+def day_6(scale: int, rng: random.Random) -> str:
+    """Races with two digit times and short records."""
+    times = [rng.randint(10, 99) for _ in range(scale)]
+    # Short records keep the concatenated part 2 race winnable
+    records = [rng.randint(1, min(time * time // 4 - 1, 99)) for time in times]
+    return (
+        "Time:      "
+        + "  ".join(f"{x:>4}" for x in times)
+        + "\nDistance:  "
+        + "  ".join(f"{x:>4}" for x in records)
+        + "\n"
+    )
+
+
+@generator(7, "number of hands")
+def day_7(scale: int, rng: random.Random) -> str:
+    """Distinct random hands with bets, as equal hands have no ranking."""
+    cards = "AKQJT98765432"
+    if scale > len(cards) ** 5:
+        raise ValueError(f"Expected at most {len(cards) ** 5} hands.")
+
+    hands: dict[str, int] = {}
+    while len(hands) < scale:
+        pool = rng.sample(cards, rng.randint(1, 5))
+        hand = "".join(rng.choice(pool) for _ in range(5))
+        bet = rng.randint(1, 1000)
+        hands.setdefault(hand, bet)
+    return "".join(f"{hand} {bet}\n" for hand, bet in hands.items())
+
+
+@generator(8, "length of the instructions")
+def day_8(scale: int, rng: random.Random) -> str:
+    """Ghost cycles whose lengths are multiples of the instructions."""
+    order = "".join(rng.choice("LR") for _ in range(max(scale, 1)))
+    cycles = rng.sample([43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97], 6)
+    alphabet = string.ascii_uppercase + string.digits
+    inner = iter(
+        name + rng.choice(alphabet[1:25])  # Must not end with A or Z
+        for name in unique_names(
+            rng, sum(2 * (len(order) * c - 1) for c in cycles), 2, alphabet
+        )
+    )
+    starts = ["AA"] + unique_names(rng, len(cycles) - 1, 2, alphabet, {"AA"})
+    ends = ["ZZ"] + unique_names(rng, len(cycles) - 1, 2, alphabet, {"ZZ"})
+    lines = []
+    for start, end, cycle in zip(starts, ends, cycles):
+        # Every step moves one position along the cycle whichever way is taken
+        columns = [
+            [next(inner), next(inner)] for _ in range(len(order) * cycle - 1)
+        ]
+        columns.append([end + "Z"] * 2)
+        lines.append(f"{start}A = ({columns[0][0]}, {columns[0][1]})")
+        for column, next_column in zip(columns, columns[1:] + columns[:1]):
+            for node in dict.fromkeys(column):
+                lines.append(f"{node} = ({next_column[0]}, {next_column[1]})")
+    rng.shuffle(lines)
+    return order + "\n\n" + "\n".join(lines) + "\n"
+
+
+@generator(9, "number of sequences")
+def day_9(scale: int, rng: random.Random) -> str:
+    """Sequences sampled from random polynomials."""
+    lines = []
+    for _ in range(scale):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        values = [
+            sum(c * x**k for k, c in enumerate(coefficients))
+            for x in range(21)
+        ]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
+
+
+@generator(10, "width and height of the grid")
+def day_10(scale: int, rng: random.Random) -> str:
+    """A pipe loop surrounded by random pipes."""
+    size = max(scale, 8)
+    loop = scale_loop(hamiltonian_loop(rng, size // 4, size // 4), 2)
+    pipes = {
+        frozenset(((-1, 0), (1, 0))): "|",
+        frozenset(((0, -1), (0, 1))): "-",
+        frozenset(((-1, 0), (0, 1))): "L",
+        frozenset(((-1, 0), (0, -1))): "J",
+        frozenset(((1, 0), (0, -1))): "7",
+        frozenset(((1, 0), (0, 1))): "F",
+    }
+    grid = [
+        [rng.choice("|-LJ7F....") for _ in range(size)] for _ in range(size)
+    ]
+    n = len(loop)
+    for k, (i, j) in enumerate(loop):
+        (p_i, p_j), (n_i, n_j) = loop[k - 1], loop[(k + 1) % n]
+        grid[i][j] = pipes[frozenset(((p_i - i, p_j - j), (n_i - i, n_j - j)))]
+    s_i, s_j = loop[rng.randrange(n)]
+    loop_cells = set(loop)
+    for d_i, d_j in itertools.pairwise((0, -1, 0, 1, 0)):
+        i, j = s_i + d_i, s_j + d_j
+        if 0 <= i < size and 0 <= j < size and (i, j) not in loop_cells:
+            grid[i][j] = "."
+    grid[s_i][s_j] = "S"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(11, "width and height of the image")
+def day_11(scale: int, rng: random.Random) -> str:
+    """Sparse galaxies with some empty rows and columns."""
+    size = max(scale, 2)
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_cols = set(rng.sample(range(size), size // 10))
+    grid = [
+        "".join(
+            "#"
+            if i not in empty_rows
+            and j not in empty_cols
+            and rng.random() < 0.02
+            else "."
+            for j in range(size)
+        )
+        for i in range(size)
+    ]
+    grid[0] = "#" + grid[0][1:]
+    return "\n".join(grid) + "\n"
+
+
+@generator(12, "number of rows of springs")
+def day_12(scale: int, rng: random.Random) -> str:
+    """Random rows of springs with some conditions unknown."""
+    lines = []
+    for _ in range(scale):
+        length = rng.randint(4, 20)
+        springs = [rng.choice("#..") for _ in range(length)]
+        if "#" not in springs:
+            springs[rng.randrange(length)] = "#"
+        groups = [
+            len(list(group))
+            for key, group in itertools.groupby(springs)
+            if key == "#"
+        ]
+        masked = "".join(c if rng.random() < 0.4 else "?" for c in springs)
+        lines.append(f"{masked} {','.join(map(str, groups))}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(13, "number of patterns")
+def day_13(scale: int, rng: random.Random) -> str:
+    """Patterns with one reflection and one smudged reflection."""
+    def differences(rows: list[str], line: int) -> int:
+        return sum(
+            a != b
+            for k in range(min(line + 1, len(rows) - line - 1))
+            for a, b in zip(rows[line - k], rows[line + k + 1])
+        )
+
+    def reflections(rows: list[str], target: int) -> list[int]:
+        columns = ["".join(column) for column in zip(*rows)]
+        return [
+            j + 1
+            for j in range(len(columns) - 1)
+            if differences(columns, j) == target
+        ] + [
+            100 * (i + 1)
+            for i in range(len(rows) - 1)
+            if differences(rows, i) == target
+        ]
+
+    def pattern() -> list[str]:
+        height, width = rng.randint(7, 17), rng.randint(7, 17)
+        # Perfect vertical reflection with unmirrored columns on the right
+        line = rng.randint(0, width // 2 - 2)
+        left = [
+            [rng.choice("#.") for _ in range(line + 1)] for _ in range(height)
+        ]
+        rows = [
+            row
+            + row[::-1]
+            + [rng.choice("#.") for _ in range(width - 2 * len(row))]
+            for row in left
+        ]
+        # Horizontal reflection off by one cell in the unmirrored columns
+        line = rng.randint(0, height - 2)
+        for k in range(min(line + 1, height - line - 1)):
+            rows[line + k + 1] = list(rows[line - k])
+        k = rng.randint(0, min(line, height - line - 2))
+        j = rng.randrange(2 * len(left[0]), width)
+        rows[line - k][j] = "#" if rows[line - k][j] == "." else "."
+        if rng.random() < 0.5:
+            rows = [list(column) for column in zip(*rows)]
+        return ["".join(row) for row in rows]
+
+    patterns = []
+    while len(patterns) < scale:
+        rows = pattern()
+        if len(reflections(rows, 0)) == len(reflections(rows, 1)) == 1:
+            patterns.append("\n".join(rows))
+    return "\n\n".join(patterns) + "\n"
+
+
+@generator(14, "width and height of the platform")
+def day_14(scale: int, rng: random.Random) -> str:
+    """A platform of randomly placed round and cubed rocks."""
+    return (
+        "\n".join(
+            "".join(rng.choice("OO#.......") for _ in range(scale))
+            for _ in range(scale)
+        )
+        + "\n"
+    )
+
+
+@generator(15, "number of steps")
+def day_15(scale: int, rng: random.Random) -> str:
+    """Initialization steps inserting and removing random labels."""
+    labels = unique_names(rng, max(scale // 4, 1), 2)
+    steps = []
+    for _ in range(scale):
+        label = rng.choice(labels)
+        if rng.random() < 0.6:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+    return ",".join(steps) + "\n"
+
+
+@generator(16, "width and height of the contraption")
+def day_16(scale: int, rng: random.Random) -> str:
+    """A contraption of randomly placed mirrors and splitters."""
+    return (
+        "\n".join(
+            "".join(rng.choice("/\\-|" + "." * 26) for _ in range(scale))
+            for _ in range(scale)
+        )
+        + "\n"
+    )
+
+
+@generator(17, "width and height of the city")
+def day_17(scale: int, rng: random.Random) -> str:
+    """A city of random heat losses."""
+    return (
+        "\n".join(
+            "".join(rng.choice("123456789") for _ in range(scale))
+            for _ in range(scale)
+        )
+        + "\n"
+    )
+
+
+@generator(18, "width and height of the dig site in blocks")
+def day_18(scale: int, rng: random.Random) -> str:
+    """A dig plan tracing a simple loop in both encodings."""
+    size = max(scale // 2, 2)
+    corners = loop_corners(hamiltonian_loop(rng, size, size))
+
+    def remap(values: set[int], max_gap: int) -> dict[int, int]:
+        result, total = {}, 0
+        for value in sorted(values):
+            result[value] = total
+            total += rng.randint(1, max_gap)
+        return result
+
+    ys = remap({y for y, _ in corners}, 9)
+    xs = remap({x for _, x in corners}, 9)
+    big_ys = remap({y for y, _ in corners}, 0xFFFFF // (size * 2))
+    big_xs = remap({x for _, x in corners}, 0xFFFFF // (size * 2))
+    letters = {(0, 1): "R", (1, 0): "D", (0, -1): "L", (-1, 0): "U"}
+    digits = {"R": 0, "D": 1, "L": 2, "U": 3}
+    lines = []
+    for (y_0, x_0), (y_1, x_1) in zip(corners, corners[1:] + corners[:1]):
+        direction = letters[
+            (y_1 > y_0) - (y_1 < y_0), (x_1 > x_0) - (x_1 < x_0)
+        ]
+        length = abs(ys[y_1] - ys[y_0]) + abs(xs[x_1] - xs[x_0])
+        big_length = abs(big_ys[y_1] - big_ys[y_0]) + abs(
+            big_xs[x_1] - big_xs[x_0]
+        )
+        lines.append(
+            f"{direction} {length} (#{big_length:05x}{digits[direction]})"
+        )
+    return "\n".join(lines) + "\n"
+
+
+@generator(19, "number of workflows")
+def day_19(scale: int, rng: random.Random) -> str:
+    """An acyclic set of workflows with random part ratings."""
+    names = ["in"] + unique_names(rng, max(scale, 1) - 1, 3, exclude={"in"})
+    lines = []
+    for k, name in enumerate(names):
+        targets = names[k + 1 :]
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            target = (
+                rng.choice(targets)
+                if targets and rng.random() < 0.7
+                else rng.choice("AR")
+            )
+            rules.append(
+                f"{rng.choice('xmas')}{rng.choice('<>')}"
+                f"{rng.randint(1, 4000)}:{target}"
+            )
+        default = (
+            rng.choice(targets)
+            if targets and rng.random() < 0.3
+            else rng.choice("AR")
+        )
+        lines.append(f"{name}{{{','.join(rules + [default])}}}")
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}"
+        for _ in range(max(scale, 1) * 2)
+    ]
+    return "\n".join(lines) + "\n\n" + "\n".join(parts) + "\n"
+
+
+@generator(20, "number of bits in each counter")
+def day_20(scale: int, rng: random.Random) -> str:
+    """Broadcaster driven binary counters feeding into rx."""
+    bits = max(scale, 3)
+    counters = 4
+    # Distinct odd cycle lengths using every bit
+    lengths: set[int] = set()
+    while len(lengths) < counters:
+        lengths.add(rng.randrange(1 << (bits - 1), 1 << bits) | 1)
+    names = unique_names(
+        rng, counters * (bits + 2) + 1, 2, exclude={"rx", "broadcaster"}
+    )
+    final = names.pop()
+    lines = []
+    broadcast = []
+    for length in sorted(lengths):
+        flip_flops = [names.pop() for _ in range(bits)]
+        conjunction, inverter = names.pop(), names.pop()
+        broadcast.append(flip_flops[0])
+        to_conjunction = []
+        for k, flip_flop in enumerate(flip_flops):
+            outputs = flip_flops[k + 1 : k + 2]
+            if length >> k & 1:
+                outputs.append(conjunction)
+                to_conjunction.append(flip_flop)
+            lines.append(f"%{flip_flop} -> {', '.join(outputs)}")
+        conjunction_outputs = [
+            flip_flop
+            for k, flip_flop in enumerate(flip_flops)
+            if not length >> k & 1 or k == 0
+        ] + [inverter]
+        lines.append(f"&{conjunction} -> {', '.join(conjunction_outputs)}")
+        lines.append(f"&{inverter} -> {final}")
+    lines.append(f"&{final} -> rx")
+    rng.shuffle(lines)
+    lines.insert(0, f"broadcaster -> {', '.join(broadcast)}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(21, "width and height of the garden")
+def day_21(scale: int, rng: random.Random) -> str:
+    """A garden with clear middle lines, edges and diamond."""
+    size = max(scale, 5) | 1
+    middle = size // 2
+    grid = []
+    for i in range(size):
+        row = []
+        for j in range(size):
+            distance = abs(i - middle) + abs(j - middle)
+            clear = (
+                i in (0, middle, size - 1)
+                or j in (0, middle, size - 1)
+                or abs(distance - middle) <= 1
+            )
+            row.append("." if clear or rng.random() > 0.15 else "#")
+        grid.append(row)
+    grid[middle][middle] = "S"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(22, "number of bricks")
+def day_22(scale: int, rng: random.Random) -> str:
+    """Non overlapping bricks at increasing heights."""
+    lines = []
+    z = 1
+    for _ in range(scale):
+        x, y = rng.randrange(10), rng.randrange(10)
+        length = rng.randint(0, 3)
+        axis = rng.randrange(3)
+        end = [x, y, z]
+        end[axis] += length
+        if end[0] > 9 or end[1] > 9:
+            end = [x, y, z]
+        lines.append(f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}")
+        z = end[2] + rng.randint(1, 3)
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+@generator(23, "number of junctions along each side of the maze")
+def day_23(scale: int, rng: random.Random) -> str:
+    """A lattice of junctions joined by winding, sloped corridors."""
+    junctions = max(scale, 2)
+    spacing = 6
+    size = 3 + (junctions - 1) * spacing + 4
+
+    edges = [
+        ((a, b), (a + d_a, b + d_b))
+        for a in range(junctions)
+        for b in range(junctions)
+        for d_a, d_b in ((0, 1), (1, 0))
+        if a + d_a < junctions and b + d_b < junctions
+    ]
+    # Drop some edges while keeping every junction reachable from the start
+    rng.shuffle(edges)
+    kept = list(edges)
+    for edge in edges:
+        if len(kept) <= len(edges) * 9 // 10:
+            break
+        candidate = [e for e in kept if e != edge]
+        # Slopes only allow moving right or down between junctions
+        reached = {(0, 0)}
+        stack = [(0, 0)]
+        while stack:
+            node = stack.pop()
+            for u, v in candidate:
+                if u == node and v not in reached:
+                    reached.add(v)
+                    stack.append(v)
+        if len(reached) == junctions * junctions:
+            kept = candidate
+
+    def draw() -> list[list[str]] | None:
+        # Jittered junctions give the corridors different lengths
+        positions = {
+            (a, b): (
+                3 + a * spacing + rng.randint(-1, 1),
+                3 + b * spacing + rng.randint(-1, 1),
+            )
+            for a in range(junctions)
+            for b in range(junctions)
+        }
+        grid = [["#"] * size for _ in range(size)]
+
+        def path(cells: list[tuple[int, int]]) -> None:
+            for (y_0, x_0), (y_1, x_1) in itertools.pairwise(cells):
+                for y in range(min(y_0, y_1), max(y_0, y_1) + 1):
+                    for x in range(min(x_0, x_1), max(x_0, x_1) + 1):
+                        grid[y][x] = "."
+
+        for u, v in kept:
+            (y_0, x_0), (y_1, x_1) = positions[u], positions[v]
+            if u[0] == v[0]:
+                middle = 3 + u[1] * spacing + spacing // 2
+                path([(y_0, x_0), (y_0, middle), (y_1, middle), (y_1, x_1)])
+                grid[y_0][x_0 + 1] = grid[y_1][x_1 - 1] = ">"
+            else:
+                middle = 3 + u[0] * spacing + spacing // 2
+                path([(y_0, x_0), (middle, x_0), (middle, x_1), (y_1, x_1)])
+                grid[y_0 + 1][x_0] = grid[y_1 - 1][x_1] = "v"
+
+        (y_0, x_0), (y_1, x_1) = positions[0, 0], positions[max(positions)]
+        path([(0, 1), (y_0, 1), (y_0, x_0)])
+        path([(y_1, x_1), (y_1, size - 2), (size - 1, size - 2)])
+
+        # Corridors must not touch each other outside of the junctions
+        ends = set(positions.values()) | {(0, 1), (size - 1, size - 2)}
+        for y, x in itertools.product(range(1, size - 1), repeat=2):
+            if grid[y][x] == "#" or (y, x) in ends:
+                continue
+            neighbours = sum(
+                grid[y + d_y][x + d_x] != "#"
+                for d_y, d_x in itertools.pairwise((0, -1, 0, 1, 0))
+            )
+            if neighbours != 2:
+                return None
+        return grid
+
+    grid = draw()
+    while grid is None:
+        grid = draw()
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(24, "number of hailstones")
+def day_24(scale: int, rng: random.Random) -> str:
+    """Hailstones that a single thrown rock hits."""
+    rock = [
+        rng.randint(150, 450) * 10**12 + rng.randrange(10**12)
+        for _ in range(3)
+    ]
+    rock_velocity = [rng.randint(-200, 200) for _ in range(3)]
+    times = iter(rng.sample(range(10**11, 10**12), 10 * max(scale, 12)))
+    hailstones: list[tuple[list[int], list[int]]] = []
+
+    def add_hailstone(velocity: list[int]) -> None:
+        time = next(times)
+        position = [
+            p + (v_r - v) * time
+            for p, v_r, v in zip(rock, rock_velocity, velocity)
+        ]
+        hailstones.append((position, velocity))
+
+    def random_velocity() -> list[int]:
+        # Real inputs have no zero components, and part 1 divides by them
+        velocity = []
+        for v_r in rock_velocity:
+            v = 0
+            while v == 0:
+                v = rng.randint(-300, 300)
+                v += v == v_r
+            velocity.append(v)
+        return velocity
+
+    def add_random_hailstone() -> None:
+        velocity = random_velocity()
+        if hailstones and rng.random() < 0.5:
+            axis = rng.randrange(3)
+            velocity[axis] = rng.choice(hailstones)[1][axis]
+        add_hailstone(velocity)
+
+    # The first two hailstones keep the part 2 slopes as small integers
+    for slope in rng.sample([-3, -2, -1, 1, 2, 3], 2):
+        velocity = random_velocity()
+        step = rng.choice((-1, 1))
+        velocity[:2] = next(
+            (v_x, v_y)
+            for d_x in (step, -step, 2 * step, -2 * step)
+            if (v_x := rock_velocity[0] + d_x)
+            and (v_y := rock_velocity[1] + slope * d_x)
+        )
+        add_hailstone(velocity)
+
+    while len(hailstones) < max(scale, 12):
+        add_random_hailstone()
+
+    # Hailstones sharing a velocity on an axis pin down the rock's velocity
+    while any(
+        candidates(hailstones, axis) != {rock_velocity[axis]}
+        for axis in range(3)
+    ):
+        for _ in range(5):
+            add_random_hailstone()
+
+    return "".join(
+        f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}\n"
+        for position, velocity in hailstones
+    )
+
+
+def candidates(
+    hailstones: list[tuple[list[int], list[int]]], axis: int
+) -> set[int]:
+    """Candidate rock velocities on an axis, as found by the day 24 solver."""
+    potential: set[int] = set()
+    by_velocity: dict[int, list[int]] = {}
+    for position, velocity in hailstones:
+        by_velocity.setdefault(velocity[axis], []).append(position[axis])
+    for velocity, positions in by_velocity.items():
+        for p_0, p_1 in itertools.combinations(positions, 2):
+            candidate = {
+                v
+                for v in range(-1000, 1000)
+                if v != velocity and (p_1 - p_0) % (v - velocity) == 0
+            }
+            potential = candidate if not potential else potential & candidate
+    return potential
+
+
+@generator(25, "number of components in each half")
+def day_25(scale: int, rng: random.Random) -> str:
+    """Two well connected halves joined by three wires."""
+    size = max(scale, 6)
+    names = unique_names(rng, 2 * size, 3)
+    edges: set[tuple[str, str]] = set()
+    for half in (names[:size], names[size:]):
+        for k, name in enumerate(half):
+            for step in (1, 2):
+                edges.add((name, half[(k + step) % size]))
+            edges.add((name, rng.choice(half)))
+    # Exactly three wires join the two halves
+    bridges: set[tuple[str, str]] = set()
+    while len(bridges) < 3:
+        bridges.add((rng.choice(names[:size]), rng.choice(names[size:])))
+    edges |= bridges
+
+    adjacency: dict[str, list[str]] = {}
+    seen: set[frozenset[str]] = set()
+    for a, b in edges:
+        if a == b or frozenset((a, b)) in seen:
+            continue
+        seen.add(frozenset((a, b)))
+        if rng.random() < 0.5:
+            a, b = b, a
+        adjacency.setdefault(a, []).append(b)
+    lines = [f"{a}: {' '.join(bs)}" for a, bs in adjacency.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc2023.generators",
+        description="Generate a synthetic input for a day.",
+        epilog="\n".join(
+            f"Day {day}: {description}" for day, description in SCALES.items()
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("scale", type=int)
+    parser.add_argument("-s", "--seed", type=int, default=None)
+    parser.add_argument(
+        "-o", "--output", default=None, help="Defaults to stdout."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    contents = generate(args.day, args.scale, args.seed)
+    if args.output is None:
+        sys.stdout.write(contents)
+        return
+
+    with open(args.output, "w", encoding=sys.getdefaultencoding()) as file:
+        file.write(contents)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Character grid stored as the raw bytes of its input file.
+
+Cells are addressed by a flat index into the bytes, so cell (i, j) is at
+i * stride + j where the stride is the width plus the trailing newline. The
+newline column is kept as a sentinel: a step off the left or right edge of a
+row lands on a newline rather than wrapping to another cell, so only the
+flat index needs bounds checking.
+
+Masks are ints holding one byte per flat index, 1 where the cell is set and
+0 elsewhere. They combine with | and &, shift with Grid.shift and count their
+set cells with int.bit_count().
+"""
+from typing import Iterator
+
+from aoc2023.inputs import read_bytes
+
+NEWLINE = ord("\n")
+
+
+def mask(data: bytes, chars: str) -> int:
+    """
+    The mask of every byte in the data that is one of the chars.
+    """
+    table = bytearray(256)
+    for char in chars.encode():
+        table[char] = 1
+    return int.from_bytes(data.translate(table), "little")
+
+
+class Grid:
+    """A rectangular character grid."""
+
+    __slots__ = ("data", "height", "width", "stride", "cells")
+
+    def __init__(self, data: bytes):
+        data = data.replace(b"\r\n", b"\n").strip(b"\n") + b"\n"
+        self.width = data.index(b"\n")
+        self.stride = self.width + 1
+        self.height, remainder = divmod(len(data), self.stride)
+        if (
+            self.width == 0
+            or remainder
+            or data[self.width :: self.stride].strip(b"\n")
+        ):
+            raise ValueError("Expected a non-empty grid of equal rows.")
+        self.data = data
+        # Every flat index except the newline column
+        self.cells = mask(data, "\n") ^ int.from_bytes(
+            b"\1" * len(data), "little"
+        )
+
+    @classmethod
+    def from_file(cls, filepath: str) -> "Grid":
+        """Load the grid in the file."""
+        return cls(read_bytes(filepath))
+
+    def __len__(self) -> int:
+        """The number of flat indices, including the newline column."""
+        return len(self.data)
+
+    def index(self, i: int, j: int) -> int:
+        """The flat index of the cell."""
+        return i * self.stride + j
+
+    def position(self, index: int) -> tuple[int, int]:
+        """The row and column of the flat index."""
+        return divmod(index, self.stride)
+
+    def in_bounds(self, index: int) -> bool:
+        """Whether the flat index is a cell of the grid."""
+        return 0 <= index < len(self.data) and self.data[index] != NEWLINE
+
+    def directions(self) -> tuple[int, int, int, int]:
+        """The flat offsets for north, east, south and west."""
+        return -self.stride, 1, self.stride, -1
+
+    def neighbours(self, index: int) -> Iterator[int]:
+        """Yields the flat indices of the cells orthogonally adjacent."""
+        for offset in self.directions():
+            if self.in_bounds(index + offset):
+                yield index + offset
+
+    def find(self, char: str) -> int:
+        """The flat index of the first cell with the char."""
+        return self.data.index(char.encode())
+
+    def find_all(self, chars: str) -> list[int]:
+        """The flat indices of every cell with one of the chars."""
+        return self.indices(self.mask(chars))
+
+    def rows(self) -> list[bytes]:
+        """The rows of the grid."""
+        return [
+            self.data[start : start + self.width]
+            for start in range(0, len(self.data), self.stride)
+        ]
+
+    def columns(self) -> list[bytes]:
+        """The columns of the grid."""
+        return [self.data[j :: self.stride] for j in range(self.width)]
+
+    def mask(self, chars: str) -> int:
+        """The mask of the cells with one of the chars."""
+        return mask(self.data, chars)
+
+    def shift(self, cells: int, d_i: int, d_j: int) -> int:
+        """
+        Move every set cell of the mask by d_i rows and d_j columns, with
+        |d_j| at most 1. Cells moved outside the grid are dropped.
+        """
+        offset = 8 * (d_i * self.stride + d_j)
+        shifted = cells << offset if offset >= 0 else cells >> -offset
+        return shifted & self.cells
+
+    def dilate(self, cells: int) -> int:
+        """The mask of the cells in or next to a set cell, diagonally too."""
+        cells |= self.shift(cells, 0, 1) | self.shift(cells, 0, -1)
+        return cells | self.shift(cells, 1, 0) | self.shift(cells, -1, 0)
+
+    def indices(self, cells: int) -> list[int]:
+        """The flat indices of the set cells of the mask."""
+        data = cells.to_bytes(len(self.data), "little")
+        result = []
+        index = data.find(1)
+        while index != -1:
+            result.append(index)
+            index = data.find(1, index + 1)
+        return result
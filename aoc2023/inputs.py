@@ -0,0 +1,67 @@
+"""
+Zero-copy access to input files as bytes.
+
+Files are memory-mapped rather than read and decoded, and split into lines
+as memoryview slices of the mapping, so nothing is copied until a solver
+converts it. Integers and tokens are parsed straight from the buffer with
+regular expressions, which accept any bytes-like object.
+
+Views into a mapping must not outlive the open_input context, so parse
+methods should return ints, bytes or other values built from them.
+"""
+import contextlib
+import mmap
+import re
+from typing import Iterator
+
+Buffer = bytes | bytearray | memoryview | mmap.mmap
+
+INTEGER = re.compile(rb"-?\d+")
+TOKEN = re.compile(rb"\S+")
+
+
+@contextlib.contextmanager
+def open_input(filepath: str) -> Iterator[bytes | mmap.mmap]:
+    """Memory-map the input file for reading."""
+    with open(filepath, "rb") as file:
+        try:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b""
+            return
+
+        with mapping:
+            yield mapping
+
+
+def read_bytes(filepath: str) -> bytes:
+    """The contents of the input file, copied once without decoding."""
+    with open_input(filepath) as data:
+        return bytes(data)
+
+
+def lines(data: bytes | mmap.mmap) -> Iterator[memoryview]:
+    """
+    Yields each line of the data without its line ending, as a view into
+    the data. A trailing newline does not start another line.
+    """
+    view = memoryview(data)
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = len(data)
+        line_end = end - 1 if end > start and data[end - 1] == 13 else end
+        yield view[start:line_end]
+        start = end + 1
+
+
+def ints(data: Buffer) -> list[int]:
+    """Every integer in the data, in order."""
+    return [int(match) for match in INTEGER.findall(data)]
+
+
+def tokens(data: Buffer, pattern: re.Pattern[bytes] = TOKEN) -> list[bytes]:
+    """Every match of the pattern in the data, by default split on spaces."""
+    return pattern.findall(data)
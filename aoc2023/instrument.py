@@ -0,0 +1,321 @@
+"""
+Opt-in instrumentation of the Day N solvers.
+
+Each part is run on the same Solver the way Solver.solve() runs them, with
+the wall time split into the parse phase (time spent in the solver's
+parsed_input methods) and the compute phase. Solvers with a true streaming
+attribute parse their input as they compute, so their phases are not split.
+Peak memory can be traced with tracemalloc, and each part can be profiled
+with cProfile or with a sampling profiler that writes folded stacks for flame
+graph tools.
+"""
+import argparse
+import collections
+import contextlib
+import cProfile
+import json
+import os
+import signal
+import sys
+import time
+import tracemalloc
+from types import FrameType
+from typing import Any, Iterable, Iterator
+
+from aoc2023 import parsed
+from aoc2023.runner import DEFAULT_INPUT, PARTS
+from aoc2023.solvers import available_days, get_solver
+
+PROFILERS = ("cprofile", "sample")
+SAMPLE_INTERVAL = 0.001
+"""Seconds of CPU time between samples of the sampling profiler."""
+
+
+def merged_duration(intervals: Iterable[tuple[float, float]]) -> float:
+    """
+    The total time covered by the intervals, so nested parse methods are
+    only counted once.
+    """
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+@contextlib.contextmanager
+def record_parses() -> Iterator[list[dict[str, Any]]]:
+    """Collect a record of every input parsed within the context."""
+    parses: list[dict[str, Any]] = []
+
+    def hook(name: str, start: float, end: float, cached: bool) -> None:
+        parses.append(
+            {"name": name, "start": start, "end": end, "cached": cached}
+        )
+
+    parsed.PARSE_HOOKS.append(hook)
+    try:
+        yield parses
+    finally:
+        parsed.PARSE_HOOKS.remove(hook)
+
+
+@contextlib.contextmanager
+def trace_memory() -> Iterator[dict[str, int]]:
+    """Record the peak traced memory, in bytes, within the context."""
+    result: dict[str, int] = {}
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        yield result
+    finally:
+        peak = tracemalloc.get_traced_memory()[1]
+        result["peak_memory"] = peak - baseline
+        if started:
+            tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def sample_stacks(
+    path: str, interval: float = SAMPLE_INTERVAL
+) -> Iterator[None]:
+    """
+    Sample the main thread's stack on a CPU timer, writing the counts of
+    each stack in the folded format to the path.
+    """
+    counts: collections.Counter[str] = collections.Counter()
+
+    def handler(_: int, frame: FrameType | None) -> None:
+        # Stop at the instrumentation's frames so only the solver is kept
+        stack = []
+        while frame is not None and frame.f_code.co_filename != __file__:
+            code = frame.f_code
+            stack.append(
+                f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                f":{code.co_firstlineno})"
+            )
+            frame = frame.f_back
+        counts[";".join(reversed(stack))] += 1
+
+    previous = signal.signal(signal.SIGPROF, handler)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous)
+        with open(path, "w", encoding=sys.getdefaultencoding()) as file:
+            for stack, count in counts.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+@contextlib.contextmanager
+def run_cprofile(path: str) -> Iterator[None]:
+    """Profile with cProfile, writing the stats to the path."""
+    with cProfile.Profile() as profiler:
+        yield
+    profiler.dump_stats(path)
+
+
+def profile(
+    profiler: str | None, path: str | None
+) -> contextlib.AbstractContextManager:
+    """The context manager that profiles with the profiler to the path."""
+    if profiler is None or path is None:
+        return contextlib.nullcontext()
+    if profiler == "sample":
+        return sample_stacks(path)
+    return run_cprofile(path)
+
+
+def instrument_day(
+    day: int,
+    parts: Iterable[int],
+    filepath: str,
+    memory: bool = False,
+    profiler: str | None = None,
+    profile_dir: str = ".",
+) -> dict[str, Any]:
+    """
+    Run the parts of a day's solver on the same Solver instance, recording
+    the parse and compute time of each part and optionally its peak memory
+    and profile.
+    """
+    record: dict[str, Any] = {"day": day, "input": filepath, "parts": []}
+    solver = get_solver(day)(filepath)
+    streamed = bool(getattr(solver, "streaming", False))
+    for part in parts:
+        part_record: dict[str, Any] = {"part": part}
+        profile_path = None
+        if profiler is not None:
+            os.makedirs(profile_dir, exist_ok=True)
+            extension = "prof" if profiler == "cprofile" else "folded"
+            profile_path = os.path.join(
+                profile_dir, f"day_{day}_part_{part}.{extension}"
+            )
+            part_record["profile"] = profile_path
+
+        with contextlib.ExitStack() as stack:
+            parses = stack.enter_context(record_parses())
+            memory_result = (
+                stack.enter_context(trace_memory()) if memory else {}
+            )
+            stack.enter_context(profile(profiler, profile_path))
+            start = time.perf_counter()
+            try:
+                part_record["answer"] = getattr(solver, f"part_{part}")()
+            except Exception as error:  # pylint: disable=broad-except
+                part_record["error"] = repr(error)
+            wall = time.perf_counter() - start
+
+        parse = (
+            None
+            if streamed
+            else merged_duration(
+                (parse_record["start"], parse_record["end"])
+                for parse_record in parses
+            )
+        )
+        part_record.update(
+            {
+                "wall": wall,
+                "streamed": streamed,
+                "parse": parse,
+                "compute": wall - parse if parse is not None else None,
+                "parses": [
+                    {
+                        "name": parse_record["name"],
+                        "wall": (
+                            parse_record["end"] - parse_record["start"]
+                        ),
+                        "cached": parse_record["cached"],
+                    }
+                    for parse_record in parses
+                ],
+                **memory_result,
+            }
+        )
+        record["parts"].append(part_record)
+    return record
+
+
+def format_record(record: dict[str, Any]) -> str:
+    """Human readable summary of a day's instrumented run."""
+    lines = [f"Day {record['day']} ({record['input']})"]
+    for part in record["parts"]:
+        result = part.get("answer", part.get("error"))
+        details = f"wall {part['wall']:.3f}s, "
+        if part["streamed"]:
+            details += "parse and compute not split (streamed)"
+        else:
+            details += (
+                f"parse {part['parse']:.3f}s, compute {part['compute']:.3f}s"
+            )
+        if "peak_memory" in part:
+            details += f", peak {part['peak_memory'] / 2**20:.1f}MiB"
+        lines.append(f"  Part {part['part']}: {result} [{details}]")
+        if "profile" in part:
+            lines.append(f"    Profile: {part['profile']}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc2023.instrument",
+        description=(
+            "Run the Day N solvers with per phase timings, peak memory and "
+            "profiles."
+        ),
+    )
+    parser.add_argument(
+        "-d",
+        "--days",
+        nargs="+",
+        type=int,
+        default=None,
+        help="Days to run, defaults to every available day.",
+    )
+    parser.add_argument(
+        "-p",
+        "--parts",
+        nargs="+",
+        type=int,
+        choices=PARTS,
+        default=list(PARTS),
+        help="Parts to run, defaults to both.",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        default=DEFAULT_INPUT,
+        help=(
+            "Input path template, {day} is replaced with the day number. "
+            f'Defaults to "{DEFAULT_INPUT}".'
+        ),
+    )
+    parser.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="Trace the peak memory of each part, this slows the solvers.",
+    )
+    parser.add_argument(
+        "--profiler",
+        choices=PROFILERS,
+        default=None,
+        help=(
+            "Profile each part, cprofile writes pstats files and sample "
+            "writes folded stacks."
+        ),
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="profiles",
+        help='Directory to write the profiles to, defaults to "profiles".',
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Write the records as JSON to this path.",
+    )
+    args = parser.parse_args(argv)
+    if args.profiler == "sample" and not hasattr(signal, "setitimer"):
+        parser.error("The sampling profiler needs signal.setitimer.")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    records = []
+    for day in args.days or available_days():
+        record = instrument_day(
+            day,
+            args.parts,
+            args.input.format(day=day),
+            args.memory,
+            args.profiler,
+            args.profile_dir,
+        )
+        print(format_record(record), flush=True)
+        records.append(record)
+
+    if args.output is not None:
+        with open(args.output, "w", encoding=sys.getdefaultencoding()) as file:
+            json.dump(records, file, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
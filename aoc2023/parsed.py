@@ -0,0 +1,119 @@
+"""
+Parse-once input layer shared by both parts of a solver.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import time
+import warnings
+from typing import Any, Callable, TypeVar
+
+from aoc2023.solvers import module_version
+
+T = TypeVar("T")
+
+CACHE_DIR_ENV = "AOC2023_PARSE_CACHE"
+"""Environment variable with the directory to persist parsed inputs to."""
+
+PARSE_HOOKS: list[Callable[[str, float, float, bool], None]] = []
+"""
+Called after a Solver parses its input with the parse method's qualified
+name, the perf_counter() before and after, and whether the result was loaded
+from the persisted cache.
+"""
+
+
+def file_digest(filepath: str) -> str:
+    """The SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path(solver: Any, function: Callable[..., Any]) -> str | None:
+    """
+    The path the parsed input is persisted to, if persisting is enabled.
+
+    The key includes the name of the module defining the method, as pickles
+    of its classes can only be loaded under that name, and the version of
+    the module and the aoc2023 modules it uses.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+
+    key = hashlib.sha256(
+        "\0".join(
+            (
+                function.__module__,
+                function.__qualname__,
+                module_version(sys.modules[function.__module__]),
+                file_digest(solver.filepath),
+            )
+        ).encode()
+    ).hexdigest()
+    return os.path.join(cache_dir, f"{key}.pickle")
+
+
+def load(path: str) -> tuple[bool, Any]:
+    """Load a persisted parsed input, returning whether it was found."""
+    try:
+        with open(path, "rb") as file:
+            return True, pickle.load(file)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # Unreadable or stale pickles are parsed again
+        return False, None
+
+
+def store(path: str, value: Any) -> None:
+    """Atomically persist a parsed input."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    try:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        warnings.warn(f"Parsed input cannot be persisted: {error}")
+        return
+
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as file:
+        file.write(data)
+    os.replace(file.name, path)
+
+
+def parsed_input(function: Callable[[Any], T]) -> Callable[[Any], T]:
+    """
+    Decorator for a Solver method that parses the solver's input file.
+
+    The method is run at most once per Solver instance and the result is
+    shared by both parts, so the result must not be mutated. If the
+    AOC2023_PARSE_CACHE environment variable is set, the result is also
+    pickled to that directory keyed by a hash of the file contents.
+    """
+    name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(self: Any) -> T:
+        parsed = self.__dict__.setdefault("_parsed_inputs", {})
+        if name in parsed:
+            return parsed[name]
+
+        start = time.perf_counter()
+        path = cache_path(self, function)
+        found, value = load(path) if path is not None else (False, None)
+        if not found:
+            value = function(self)
+            if path is not None:
+                store(path, value)
+
+        parsed[name] = value
+        end = time.perf_counter()
+        for hook in PARSE_HOOKS:
+            hook(function.__qualname__, start, end, found)
+        return value
+
+    return wrapper
@@ -0,0 +1,180 @@
+"""
+Content-addressed cache of solver answers.
+
+Answers are keyed by the day, the part, a hash of the input and the solver's
+version, so editing a solver or its input never returns a stale answer. The
+cache has an in-memory least recently used tier in front of an optional
+on-disk tier, which evicts its least recently used answers once it grows
+past a size limit.
+"""
+import collections
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import warnings
+from typing import Any
+
+from aoc2023.parsed import file_digest
+from aoc2023.solvers import solver_version
+
+CACHE_DIR_ENV = "AOC2023_RESULT_CACHE"
+"""Environment variable with the directory to persist answers to."""
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+def content_digest(contents: str | bytes) -> str:
+    """The SHA-256 hex digest of an input, matching file_digest."""
+    if isinstance(contents, str):
+        contents = contents.encode()
+    return hashlib.sha256(contents).hexdigest()
+
+
+def result_key(day: int, part: int, input_digest: str) -> str:
+    """The cache key of the answer to the part of the day for an input."""
+    return hashlib.sha256(
+        "\0".join(
+            (str(day), str(part), input_digest, solver_version(day))
+        ).encode()
+    ).hexdigest()
+
+
+class ResultCache:
+    """Two tier cache of answers, safe to share between threads."""
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory: collections.OrderedDict[str, Any] = (
+            collections.OrderedDict()
+        )
+        self.hits = self.misses = 0
+        self.lock = threading.Lock()
+        # Size of the disk tier, measured on the first write to it
+        self.disk_bytes: int | None = None
+
+    def path(self, key: str) -> str:
+        """The path the answer is persisted to."""
+        assert self.directory is not None
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Look up an answer, returning whether it was found."""
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return True, self.memory[key]
+
+        if self.directory is not None:
+            path = self.path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    answer = json.load(file)["answer"]
+            except (FileNotFoundError, json.JSONDecodeError, KeyError):
+                pass
+            else:
+                # Mark the answer as recently used for eviction
+                with contextlib.suppress(FileNotFoundError):
+                    os.utime(path)
+                self.remember(key, answer)
+                with self.lock:
+                    self.hits += 1
+                return True, answer
+
+        with self.lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, key: str, answer: Any) -> None:
+        """Cache an answer in both tiers."""
+        self.remember(key, answer)
+        if self.directory is None:
+            return
+
+        try:
+            data = json.dumps({"answer": answer})
+        except TypeError as error:
+            warnings.warn(f"Answer cannot be persisted: {error}")
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            file.write(data)
+        os.replace(file.name, self.path(key))
+
+        with self.lock:
+            if self.disk_bytes is None:
+                self.disk_bytes = sum(size for _, size, _ in self.entries())
+            else:
+                self.disk_bytes += len(data)
+            if self.disk_bytes > self.max_bytes:
+                self.evict()
+
+    def remember(self, key: str, answer: Any) -> None:
+        """Cache an answer in memory, evicting the least recently used."""
+        if self.max_entries <= 0:
+            return
+        with self.lock:
+            self.memory[key] = answer
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.max_entries:
+                self.memory.popitem(last=False)
+
+    def entries(self) -> list[tuple[float, int, str]]:
+        """The last use, size and path of every persisted answer."""
+        assert self.directory is not None
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                with contextlib.suppress(FileNotFoundError):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used persisted answers until the disk tier
+        fits within its size limit.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+        self.disk_bytes = total
+
+    def solve(self, solver: Any, day: int, part: int) -> tuple[bool, Any]:
+        """
+        The answer to the part from the cache or from solving it, returning
+        whether it was cached.
+        """
+        key = result_key(day, part, file_digest(solver.filepath))
+        found, answer = self.get(key)
+        if not found:
+            answer = getattr(solver, f"part_{part}")()
+            self.put(key, answer)
+        return found, answer
+
+
+def from_environment() -> ResultCache | None:
+    """
+    The cache persisting to the AOC2023_RESULT_CACHE directory, if the
+    environment variable is set.
+    """
+    directory = os.environ.get(CACHE_DIR_ENV)
+    return ResultCache(directory) if directory else None
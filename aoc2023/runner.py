@@ -0,0 +1,186 @@
+"""
+Run any set of days and parts across a process pool, recording timings.
+"""
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+from typing import Any, Iterable
+
+from aoc2023 import results
+from aoc2023.solvers import available_days, get_solver
+
+PARTS = (1, 2)
+DEFAULT_INPUT = "Day {day}/input.txt"
+
+
+def cpu_time() -> float:
+    """CPU time used by this process and its reaped children."""
+    times = os.times()
+    return (
+        times.user
+        + times.system
+        + times.children_user
+        + times.children_system
+    )
+
+
+def run_day(day: int, parts: Iterable[int], filepath: str) -> dict[str, Any]:
+    """
+    Run the parts of a day's solver on the same Solver instance,
+    recording the wall and CPU time of each part and of the whole day.
+    Answers are cached if the AOC2023_RESULT_CACHE environment variable is
+    set.
+    """
+    cache = results.from_environment()
+    record: dict[str, Any] = {"day": day, "input": filepath, "parts": []}
+    day_wall, day_cpu = time.perf_counter(), cpu_time()
+    try:
+        solver = get_solver(day)(filepath)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        record["error"] = repr(error)
+        parts = ()
+
+    for part in parts:
+        part_record: dict[str, Any] = {"part": part}
+        wall, cpu = time.perf_counter(), cpu_time()
+        try:
+            if cache is None:
+                part_record["answer"] = getattr(solver, f"part_{part}")()
+            else:
+                part_record["cached"], part_record["answer"] = cache.solve(
+                    solver, day, part
+                )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            part_record["error"] = repr(error)
+        part_record["wall"] = time.perf_counter() - wall
+        part_record["cpu"] = cpu_time() - cpu
+        record["parts"].append(part_record)
+
+    record["wall"] = time.perf_counter() - day_wall
+    record["cpu"] = cpu_time() - day_cpu
+    return record
+
+
+def format_record(record: dict[str, Any]) -> str:
+    """Human readable summary of a day's record."""
+    lines = [f"Day {record['day']} ({record['input']})"]
+    if "error" in record:
+        lines.append(f"  Error: {record['error']}")
+    for part in record["parts"]:
+        result = part.get("answer", part.get("error"))
+        cached = ", cached" if part.get("cached") else ""
+        lines.append(
+            f"  Part {part['part']}: {result}"
+            f" [wall {part['wall']:.3f}s, cpu {part['cpu']:.3f}s{cached}]"
+        )
+    lines.append(
+        f"  Total: wall {record['wall']:.3f}s, cpu {record['cpu']:.3f}s"
+    )
+    return "\n".join(lines)
+
+
+def run(
+    days: Iterable[int],
+    parts: Iterable[int] = PARTS,
+    input_template: str = DEFAULT_INPUT,
+    workers: int | None = None,
+    verbose: bool = True,
+) -> dict[str, Any]:
+    """
+    Run the days in a process pool. Each day runs in a single worker so both
+    parts share the same Solver, while separate days run concurrently.
+    """
+    days, parts = list(days), list(parts)
+    start = time.perf_counter()
+    records = []
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(
+                run_day, day, parts, input_template.format(day=day)
+            )
+            for day in days
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            record = future.result()
+            if verbose:
+                print(format_record(record), flush=True)
+            records.append(record)
+
+    records.sort(key=lambda record: record["day"])
+    return {
+        "workers": workers or os.cpu_count(),
+        "wall": time.perf_counter() - start,
+        "days": records,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc2023",
+        description="Run the Day N solvers in a process pool.",
+    )
+    parser.add_argument(
+        "-d",
+        "--days",
+        nargs="+",
+        type=int,
+        default=None,
+        help="Days to run, defaults to every available day.",
+    )
+    parser.add_argument(
+        "-p",
+        "--parts",
+        nargs="+",
+        type=int,
+        choices=PARTS,
+        default=list(PARTS),
+        help="Parts to run, defaults to both.",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        default=DEFAULT_INPUT,
+        help=(
+            "Input path template, {day} is replaced with the day number. "
+            f'Defaults to "{DEFAULT_INPUT}".'
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes, defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Write the timings as JSON to this path.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    days = args.days or available_days()
+    missing = set(days) - set(available_days())
+    if missing:
+        print(f"No solver for days: {sorted(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    summary = run(days, args.parts, args.input, args.workers)
+    print(f"Total wall time: {summary['wall']:.3f}s")
+
+    if args.output is not None:
+        with open(args.output, "w", encoding=sys.getdefaultencoding()) as file:
+            json.dump(summary, file, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
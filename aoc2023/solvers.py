@@ -0,0 +1,85 @@
+"""
+Discovery and loading of the Day N solvers.
+"""
+import functools
+import hashlib
+import importlib.util
+import inspect
+import pathlib
+import re
+import sys
+from types import ModuleType
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+"""The repository root containing the Day N directories."""
+DAY_PATTERN = re.compile(r"Day (\d+)")
+
+
+def available_days() -> list[int]:
+    """All the days with a Python solver, in ascending order."""
+    return sorted(
+        int(match[1])
+        for path in ROOT.glob("Day */solution.py")
+        if (match := DAY_PATTERN.fullmatch(path.parent.name))
+    )
+
+
+def solver_path(day: int) -> pathlib.Path:
+    """The path to the day's Python solver."""
+    return ROOT / f"Day {day}" / "solution.py"
+
+
+@functools.cache
+def load_module(day: int) -> ModuleType:
+    """
+    Import the day's solution module.
+
+    The module is registered in sys.modules so that anything defined in it
+    can be pickled and sent to other processes.
+    """
+    path = solver_path(day)
+    if not path.is_file():
+        raise ValueError(f"No solver found for day {day}.")
+
+    name = f"aoc2023_day_{day}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(name)
+        raise
+    return module
+
+
+def get_solver(day: int) -> type:
+    """The day's Solver class."""
+    return load_module(day).Solver
+
+
+@functools.cache
+def module_version(module: ModuleType) -> str:
+    """
+    A SHA-256 hex digest of the module's source and of the source of every
+    aoc2023 module it uses.
+    """
+    paths = {pathlib.Path(inspect.getfile(module))}
+    for value in vars(module).values():
+        source = inspect.getmodule(value)
+        if source is not None and source.__name__.startswith("aoc2023."):
+            paths.add(pathlib.Path(inspect.getfile(source)))
+
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def solver_version(day: int) -> str:
+    """
+    A SHA-256 hex digest of the day's solver source and of the source of
+    every aoc2023 module it uses, which changes whenever its answers might.
+    """
+    return module_version(load_module(day))